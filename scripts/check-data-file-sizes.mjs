@@ -11,7 +11,6 @@ const defaultLimit = 5 * MIB;
 const exceptions = new Map([
   ['data/market/natural_barriers_co.geojson', 11 * MIB],
   ['data/market/flood_zones_co.geojson', 7 * MIB],
-  ['data/hna/source/dola_sya_county.csv', 21 * MIB],
   ['data/market/lodes_tract_od_co.json', 15 * MIB],
 ]);
 
@@ -14,17 +14,28 @@ Designed to run in GitHub Actions. All sources are public.
 from __future__ import annotations
 
 import csv
+import functools
 import glob
 import gzip
+import hashlib
+import http.client
 import io
 import json
 import os
+import random
+import re
 import subprocess
 import sys
+import threading
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
+import zlib
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 
@@ -43,6 +54,37 @@ try:
 except ImportError:
     _acs_diag = None  # type: ignore[assignment]
 
+# orjson is optional: it parses the number-heavy Census JSON bodies several
+# times faster than the stdlib, but the build must keep working without it
+# (CI installs no extra packages).  orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so callers catch the same exception either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialise *obj* to JSON bytes for the data/hna outputs.
+
+    Always the stdlib encoder with its default settings, i.e. byte-for-byte
+    what ``json.dump(obj, f)`` has always written to the committed files
+    (', ' / ': ' separators, non-ASCII escaped, NaN written as NaN).
+    orjson is only used for parsing: its compact, UTF-8, NaN-as-null
+    output would rewrite every committed file.
+    """
+    return json.dumps(obj).encode('ascii')
+
+# python-isal's igzip is a drop-in replacement for the gzip module backed by
+# ISA-L's SIMD inflate — several times faster on the LEHD LODES .csv.gz
+# files.  Optional, like orjson; the stdlib gzip module is the fallback.
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    _gzip = gzip  # type: ignore[assignment]
+
 STATE_FIPS_CO = '08'
 
 FEATURED = [
@@ -70,116 +112,325 @@ OUT = {
 # ============================================================================
 
 
+_MKDIR_CACHE: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """os.makedirs(path, exist_ok=True), skipped for directories already made.
+
+    Cache and output files are written hundreds of times into the same few
+    directories; this avoids a makedirs/stat round-trip per write.
+    """
+    if path in _MKDIR_CACHE:
+        return
+    os.makedirs(path, exist_ok=True)
+    _MKDIR_CACHE.add(path)
+
+
 def utc_now_z() -> str:
     """Return ISO 8601 UTC timestamp string ending with 'Z'."""
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+@functools.cache
+def _redactor() -> tuple[re.Pattern[str] | None, dict[str, str]]:
+    """Compiled single-pass redaction pattern and its secret → placeholder map.
+
+    Read from the environment once; the keys do not change during a build.
+    Call ``_redactor.cache_clear()`` after changing CENSUS_API_KEY /
+    FRED_API_KEY in-process.
+    """
+    masks = {}
+    for name in ('CENSUS_API_KEY', 'FRED_API_KEY'):
+        val = os.environ.get(name, '')
+        if len(val) >= 8:
+            masks.setdefault(val, f'***{name}***')
+    if not masks:
+        return (None, masks)
+    # Longest first so a key that contains the other is masked whole.
+    alternation = '|'.join(re.escape(k) for k in sorted(masks, key=len, reverse=True))
+    return (re.compile(alternation), masks)
+
+
 def redact(s: str) -> str:
     """Redact sensitive API keys from logs.
 
     Only replaces keys that are at least 8 characters long to avoid corrupting
     log output when an env var is accidentally set to a short or single-character
     value (which would replace every occurrence of that character in the URL).
+    Both keys are masked in one regex pass.
     """
-    census_key_val = os.environ.get('CENSUS_API_KEY', '')
-    fred_key_val = os.environ.get('FRED_API_KEY', '')
-    if len(census_key_val) >= 8:
-        s = s.replace(census_key_val, '***CENSUS_API_KEY***')
-    if len(fred_key_val) >= 8:
-        s = s.replace(fred_key_val, '***FRED_API_KEY***')
-    return s
+    pattern, masks = _redactor()
+    if pattern is None:
+        return s
+    return pattern.sub(lambda m: masks[m.group(0)], s)
+
+
+_HTTP_USER_AGENT = "HNA-ETL/1.0"
+# Census JSON and the DOLA CSVs compress 5-20x; ask for it and inflate below.
+_HTTP_ACCEPT_ENCODING = "gzip, deflate"
+
+
+@functools.cache
+def _http_opener() -> urllib.request.OpenerDirector:
+    """The one urllib opener every request in the build goes through.
+
+    Built once, so the HTTP(S)_PROXY / NO_PROXY environment is read once per
+    run; redirects and proxies are handled exactly as by urlopen().
+    """
+    return urllib.request.build_opener()
+
+
+def _decode_content(body: bytes, encoding: str | None) -> bytes:
+    """Undo a gzip/deflate Content-Encoding; identity bodies pass through."""
+    encoding = (encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return _gzip.decompress(body)
+    if encoding == 'deflate':
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib wrapper.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
 
 
-def http_get_text(url: str, timeout: int = 30, retries: int = 3, backoff: float = 1.7) -> tuple[int, str]:
-    """Fetch URL with exponential backoff retry.
+def _http_request(url: str, timeout: float = 30,
+                  headers: dict[str, str] | None = None) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """GET *url*, following redirects.
+
+    Returns (status, reason, response_headers, body_bytes) for any HTTP status,
+    with any gzip/deflate Content-Encoding already removed from the body;
+    raises OSError on network-level failure.
+    """
+    req_headers = {"User-Agent": _HTTP_USER_AGENT, "Accept-Encoding": _HTTP_ACCEPT_ENCODING}
+    if headers:
+        req_headers.update(headers)
+    req = urllib.request.Request(url, headers=req_headers)
+    with _HTTP_SLOTS:
+        try:
+            with _http_opener().open(req, timeout=timeout) as r:
+                status, reason, resp_headers, body = r.status, r.reason, r.headers, r.read()
+        except urllib.error.HTTPError as e:
+            status, reason, resp_headers = e.code, e.reason, e.headers
+            try:
+                body = e.read()
+            except Exception:
+                body = b''
+            finally:
+                e.close()
+    return (status, reason, resp_headers, _decode_content(body, resp_headers.get('Content-Encoding')))
+
+
+def _retry_delay(headers, wait: float, max_wait: float) -> float:
+    """Seconds to sleep before the next attempt.
+
+    Honours a ``Retry-After`` header (delta-seconds or HTTP-date) when the
+    server sends one; otherwise jitters the geometric *wait* by ±50% so
+    concurrent workers do not retry in lockstep.  Never exceeds *max_wait*.
+    """
+    retry_after = headers.get('Retry-After') if headers is not None else None
+    if retry_after:
+        retry_after = retry_after.strip()
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(max(delay, 0.0), max_wait)
+    return min(wait * random.uniform(0.5, 1.5), max_wait)
+
+
+def http_get_text(url: str, timeout: int = 30, retries: int = 3, backoff: float = 1.7,
+                  max_wait: float = 30.0) -> tuple[int, str]:
+    """Fetch URL with jittered exponential backoff retry.
     
     Returns: (status_code, text)
     On error, returns (status_code, error_message)
+    Retryable statuses wait for the server's Retry-After when present;
+    no single wait exceeds *max_wait* seconds.
     """
+    status, body, _ = _http_get_text_with_headers(url, timeout, retries, backoff, max_wait)
+    return (status, body)
+
+
+def _http_get_text_with_headers(url: str, timeout: int = 30, retries: int = 3, backoff: float = 1.7,
+                                max_wait: float = 30.0, headers: dict[str, str] | None = None,
+                                ) -> tuple[int, str, http.client.HTTPMessage | None]:
+    """http_get_text() that also sends *headers* and returns the response headers.
+
+    Only a 2xx counts as success, plus 304 when *headers* made the request
+    conditional.  The third element is None when no response was received.
+    """
+    conditional = bool(headers) and ('If-None-Match' in headers or 'If-Modified-Since' in headers)
     wait = 1
     for attempt in range(retries):
         print(f"→ GET external source  (attempt {attempt + 1}/{retries}, timeout={timeout}s)", file=sys.stderr)
         t0 = time.monotonic()
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "HNA-ETL/1.0"})
-            with urllib.request.urlopen(req, timeout=timeout) as r:
-                body = r.read().decode('utf-8', errors='replace')
-                status = r.status
-            elapsed = time.monotonic() - t0
-            print(f"← {status} OK  {len(body):,} bytes  {elapsed:.1f}s", file=sys.stderr)
-            return (status, body)
-        except urllib.error.HTTPError as e:
-            elapsed = time.monotonic() - t0
-            status = e.code
-            try:
-                body = e.read().decode('utf-8', errors='replace')
-            except Exception:
-                body = ''
-            print(f"← HTTP {status}  {elapsed:.1f}s  fetching external source (attempt {attempt + 1}/{retries})", file=sys.stderr)
-            if status >= 400:
-                # Log response body preview for all API errors to aid debugging.
-                # Error bodies can echo the request URL (with API key) — redact
-                # before truncating so a key can't straddle the cut.
-                print(f"  Response: {redact(body)[:1000]}", file=sys.stderr)
-            if status in (408, 429, 500, 502, 503, 504) and attempt < retries - 1:
-                time.sleep(wait)
-                wait *= backoff
-                continue
-            return (status, body or f"HTTP {status}: {e.reason}")
+            status, reason, resp_headers, raw = _http_request(url, timeout=timeout, headers=headers)
         except Exception as e:
             elapsed = time.monotonic() - t0
             print(f"← ERROR  {elapsed:.1f}s  fetching external source (attempt {attempt + 1}/{retries}): {e}", file=sys.stderr)
             if attempt < retries - 1:
-                time.sleep(wait)
+                time.sleep(_retry_delay(None, wait, max_wait))
                 wait *= backoff
                 continue
-            return (0, str(e))
-    return (0, "Max retries exceeded")
+            return (0, str(e), None)
+        elapsed = time.monotonic() - t0
+        body = raw.decode('utf-8', errors='replace')
+        if 200 <= status < 300 or (status == 304 and conditional):
+            print(f"← {status} OK  {len(body):,} bytes  {elapsed:.1f}s", file=sys.stderr)
+            return (status, body, resp_headers)
+        print(f"← HTTP {status}  {elapsed:.1f}s  fetching external source (attempt {attempt + 1}/{retries})", file=sys.stderr)
+        # Log response body preview for all API errors to aid debugging.
+        # Error bodies can echo the request URL (with API key) — redact
+        # before truncating so a key can't straddle the cut.
+        print(f"  Response: {redact(body)[:1000]}", file=sys.stderr)
+        if status in (408, 429, 500, 502, 503, 504) and attempt < retries - 1:
+            time.sleep(_retry_delay(resp_headers, wait, max_wait))
+            wait *= backoff
+            continue
+        return (status, body or f"HTTP {status}: {reason}", resp_headers)
+    return (0, "Max retries exceeded", None)
 
 
-def http_get_json(url: str, timeout: int = 30) -> dict | list | None:
-    """Fetch URL and parse as JSON. Returns None on error."""
-    status, text = http_get_text(url, timeout=timeout, retries=1)
+# Concurrency for independent GETs (per-county Census queries and the like).
+# Kept modest so the unauthenticated Census API quota and the upstream hosts
+# are not hammered.  main() runs its stage lanes side by side and each sizes
+# its own worker pool by this, so _HTTP_SLOTS also caps the requests in
+# flight across the whole process at the same number.
+_HTTP_MAX_WORKERS = 8
+_HTTP_SLOTS = threading.BoundedSemaphore(_HTTP_MAX_WORKERS)
+
+
+def http_get_text_many(urls: list[str], timeout: int = 30, retries: int = 3,
+                       max_workers: int = _HTTP_MAX_WORKERS) -> list[tuple[int, str]]:
+    """http_get_text() for a batch of independent URLs, fetched concurrently.
+
+    Returns one (status_code, text) per URL, in the order of *urls*.
+    """
+    if len(urls) <= 1 or max_workers <= 1:
+        return [http_get_text(u, timeout=timeout, retries=retries) for u in urls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as pool:
+        return list(pool.map(lambda u: http_get_text(u, timeout=timeout, retries=retries), urls))
+
+
+# Optional on-disk cache for Census/TIGERweb responses.  Set ACS_PROBE_CACHE_DIR to
+# a scratch directory to let repeat runs (local iteration, CI retries) replay
+# recent responses instead of re-querying the API.  Unset by default so CI
+# builds always see live data.
+_PROBE_CACHE_TTL_OK = 24 * 3600
+_PROBE_CACHE_TTL_FAIL = 10 * 60
+
+
+def _build_cache_dir() -> str | None:
+    """The HNA_BUILD_CACHE_DIR scratch directory, or None when it is unset.
+
+    Holds derived build state that is not an output and must never be
+    committed, such as the parsed DOLA SYA aggregates (see _load_dola_sya).
+    Separate from ACS_PROBE_CACHE_DIR: that one replays HTTP responses,
+    which CI must not do, while this one only skips recomputation.
+    """
+    return os.environ.get('HNA_BUILD_CACHE_DIR', '').strip() or None
+
+
+def _probe_cache_path(url: str, suffix: str = '.json') -> str | None:
+    """Return the cache file for *url*, or None when caching is disabled.
+
+    The ``key=`` query parameter is dropped before hashing so rotating
+    CENSUS_API_KEY does not invalidate existing entries.
+    """
+    cache_dir = os.environ.get('ACS_PROBE_CACHE_DIR', '').strip()
+    if not cache_dir:
+        return None
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True) if k != 'key']
+    keyless = urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+    return os.path.join(cache_dir, hashlib.sha1(keyless.encode('utf-8')).hexdigest() + suffix)
+
+
+def _cached_get_text(url: str, timeout: int = 30, retries: int = 1) -> tuple[int, str]:
+    """http_get_text() with the optional ACS_PROBE_CACHE_DIR response cache."""
+    cache_path = _probe_cache_path(url)
+    if cache_path is None:
+        return http_get_text(url, timeout=timeout, retries=retries)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        ttl = _PROBE_CACHE_TTL_OK if entry['status'] == 200 else _PROBE_CACHE_TTL_FAIL
+        if time.time() - entry['ts'] < ttl:
+            return (entry['status'], entry['raw'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    status, text = http_get_text(url, timeout=timeout, retries=retries)
+    try:
+        _ensure_dir(os.path.dirname(cache_path))
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'status': status, 'raw': text, 'ts': time.time()}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠ Could not write probe cache {cache_path}: {e}", file=sys.stderr)
+    return (status, text)
+
+
+def http_get_json_with_status(url: str, timeout: int = 30) -> tuple[int, dict | list | None]:
+    """Fetch URL and parse as JSON.
+
+    Returns (status_code, parsed); parsed is None on HTTP or parse error.
+    Lets callers branch on the status without issuing a second request.
+    """
+    status, text = _cached_get_text(url, timeout=timeout, retries=1)
     if status != 200:
         print(f"⚠ Failed to fetch JSON from external source: HTTP {status}", file=sys.stderr)
         print(f"  Response preview: {redact(text)[:500]}", file=sys.stderr)
-        return None
+        return (status, None)
     try:
-        return json.loads(text)
+        return (status, _json_loads(text))
     except json.JSONDecodeError as e:
         print(f"⚠ Failed to parse JSON from external source: {e}", file=sys.stderr)
-        return None
+        return (status, None)
+
+
+def http_get_json(url: str, timeout: int = 30) -> dict | list | None:
+    """Fetch URL and parse as JSON. Returns None on error."""
+    return http_get_json_with_status(url, timeout=timeout)[1]
 
 
-_ACS5_DETAIL_TENURE_CACHE: dict[str, dict[str, str]] | None = None
-_ACS5_DETAIL_TENURE_CACHE_KEY: tuple[int, ...] | None = None
+# Statewide tenure lookups keyed by the years tuple.  build_summary_cache
+# fetches geographies on worker threads: the first caller fetches the lookup
+# and the rest wait on its Future (see _once()).
+_ACS5_DETAIL_TENURE: dict[tuple[int, ...], 'Future[dict[str, dict[str, str]]]'] = {}
+_ACS5_DETAIL_TENURE_LOCK = threading.Lock()
 
 
-def _fetch_acs5_detail_tenure_lookup(years_to_try: list[int]) -> dict[str, dict[str, str]]:
+def _fetch_acs5_detail_tenure_lookup(years_to_try: tuple[int, ...]) -> dict[str, dict[str, str]]:
     """Fetch ACS5 detail-table ownership supplements for Colorado counties and places."""
-    global _ACS5_DETAIL_TENURE_CACHE, _ACS5_DETAIL_TENURE_CACHE_KEY
-    cache_key = tuple(years_to_try)
-    if _ACS5_DETAIL_TENURE_CACHE is not None and _ACS5_DETAIL_TENURE_CACHE_KEY == cache_key:
-        return _ACS5_DETAIL_TENURE_CACHE
+    years_to_try = tuple(years_to_try)
+    return _once(_ACS5_DETAIL_TENURE, _ACS5_DETAIL_TENURE_LOCK, years_to_try,
+                 lambda: _fetch_acs5_detail_tenure_rows(years_to_try))
+
 
+def _fetch_acs5_detail_tenure_rows(years_to_try: tuple[int, ...]) -> dict[str, dict[str, str]]:
     lookup: dict[str, dict[str, str]] = {}
     b25075_vars = [f'B25075_{i:03d}E' for i in range(1, 28)]
     vars_ = ['B25003_001E', 'B25003H_001E', *b25075_vars, 'NAME']
-    key = census_key()
 
     def fetch_scope(scope: str) -> bool:
+        qs = f"get={','.join(vars_)}&for={scope}:*&in=state:{STATE_FIPS_CO}"
+        qs += census_key_param()
         for year in years_to_try:
-            qs = f"get={','.join(vars_)}&for={scope}:*&in=state:{STATE_FIPS_CO}"
-            if key:
-                qs += f"&key={urllib.parse.quote(key, safe='')}"
             url = f"https://api.census.gov/data/{year}/acs/acs5?{qs}"
             result = http_get_json(url)
             if not result or len(result) <= 1:
                 continue
             header = result[0]
             for row in result[1:]:
-                rec = {header[i]: row[i] for i in range(len(header))}
+                rec = dict(zip(header, row))
                 if scope == 'county':
                     geoid = STATE_FIPS_CO + rec['county']
                 else:
@@ -193,56 +444,72 @@ def _fetch_acs5_detail_tenure_lookup(years_to_try: list[int]) -> dict[str, dict[
 
     fetch_scope('county')
     fetch_scope('place')
-    _ACS5_DETAIL_TENURE_CACHE = lookup
-    _ACS5_DETAIL_TENURE_CACHE_KEY = cache_key
     return lookup
 
 
-def _acs5_detail_tenure_for_geo(geo_type: str, geoid: str, years_to_try: list[int]) -> dict[str, str] | None:
+def _acs5_detail_tenure_for_geo(geo_type: str, geoid: str, years_to_try: tuple[int, ...]) -> dict[str, str] | None:
     """Return cached ACS5 Detail Table tenure/race fields for one geography."""
     lookup = _fetch_acs5_detail_tenure_lookup(years_to_try)
     return lookup.get(geoid)
 
 
+# Header-row heuristics for banner-prefixed CSVs (DOLA/SDO files open with
+# "Vintage 2023 ..." style rows).  Compiled once and tested against the raw
+# line so banner and data rows are rejected without splitting them.
+# read_csv_with_banner_skip wants a field that *is* one of its keywords;
+# detect_header_and_reader accepts any field that *contains* one.
+_BANNER_HEADER_FIELD_RE = re.compile(r'(?i)(?:^|,)\s*(?:fips|countyfips|geoid|age|year)\s*(?:,|$)')
+_HEADER_KEYWORD_RE = re.compile(r'(?i)fips|county|year|age|pop|hh|unit|vac')
+
+
 def read_csv_with_banner_skip(path: str, encoding: str = "utf-8") -> tuple[list[str], list[dict]]:
     """Read CSV, auto-detecting and skipping banner rows.
     
     Returns: (header_list, row_list_of_dicts)
     Skips leading rows that don't look like headers (e.g., "Vintage 2023...").
+    The file is streamed: lines are read only until the header is found and
+    the remaining rows go straight from the file handle into csv.reader.
     """
-    try:
-        with open(path, 'r', encoding=encoding) as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"⚠ Error reading {path}: {e}", file=sys.stderr)
-        return ([], [])
-
-    # Find first line that looks like a header
     header = None
-    start_idx = 0
-    for i, line in enumerate(lines):
-        fields = [f.strip() for f in line.split(',')]
-        # Heuristic: header should have >=3 non-empty fields AND contain a known column
-        if len([f for f in fields if f]) >= 3:
-            fields_lower = [f.lower() for f in fields]
-            if any(col in fields_lower for col in ['fips', 'countyfips', 'geoid', 'age', 'year']):
-                header = fields
-                start_idx = i
-                break
-
-    if header is None:
-        print(f"⚠ Could not detect CSV header in {path}", file=sys.stderr)
-        return ([], [])
-
-    # Parse remaining rows
     rows = []
     try:
-        reader = csv.DictReader(lines[start_idx:])
-        for row in reader:
-            if row:
-                rows.append(row)
+        with open(path, 'r', encoding=encoding, newline='') as f:
+            # Find first line that looks like a header
+            for line in iter(f.readline, ''):
+                # Heuristic: header should have >=3 non-empty fields AND contain a known column.
+                # Three fields need at least two commas, so most banner rows
+                # are rejected before the regex runs.
+                if line.count(',') < 2 or not _BANNER_HEADER_FIELD_RE.search(line):
+                    continue
+                fields = [f.strip() for f in line.split(',')]
+                if len([f for f in fields if f]) >= 3:
+                    header = fields
+                    break
+
+            if header is None:
+                print(f"⚠ Could not detect CSV header in {path}", file=sys.stderr)
+                return ([], [])
+
+            # Parse remaining rows.  Row dicts are keyed exactly as
+            # csv.DictReader would key them (short rows padded with None,
+            # overflow collected under the None key).
+            keys = next(csv.reader([line]))
+            n_keys = len(keys)
+            try:
+                for rec in csv.reader(f):
+                    if not rec:
+                        continue
+                    row = dict(zip(keys, rec))
+                    if len(rec) > n_keys:
+                        row[None] = rec[n_keys:]
+                    elif len(rec) < n_keys:
+                        row.update(dict.fromkeys(keys[len(rec):]))
+                    rows.append(row)
+            except Exception as e:
+                print(f"⚠ Error parsing CSV rows from {path}: {e}", file=sys.stderr)
     except Exception as e:
-        print(f"⚠ Error parsing CSV rows from {path}: {e}", file=sys.stderr)
+        print(f"⚠ Error reading {path}: {e}", file=sys.stderr)
+        return ([], [])
 
     return (header, rows)
 
@@ -253,12 +520,11 @@ def census_fetch(url: str, fallback_url: str | None = None) -> dict | None:
     Returns: JSON dict or None on failure.
     Tries primary URL; if HTTP 400, tries fallback_url if provided.
     """
-    result = http_get_json(url)
+    status, result = http_get_json_with_status(url)
     if result is not None:
         return result
 
     # If HTTP 400 (Bad Request) and we have a fallback, try it
-    status, _ = http_get_text(url, timeout=30, retries=1)
     if status == 400 and fallback_url:
         print("ℹ Falling back to alternate external source", file=sys.stderr)
         return http_get_json(fallback_url)
@@ -267,34 +533,107 @@ def census_fetch(url: str, fallback_url: str | None = None) -> dict | None:
 
 
 def http_get(url: str, timeout: int = 60) -> bytes:
-    """Original http_get for LEHD (critical path, no fallback)."""
+    """Original http_get for LEHD (critical path, no fallback).
+
+    Successful bodies go through the optional ACS_PROBE_CACHE_DIR cache
+    (stored as raw bytes, expired by file mtime); errors are never cached.
+    """
+    cache_path = _probe_cache_path(url, suffix='.bin')
+    if cache_path is not None:
+        try:
+            if time.time() - os.path.getmtime(cache_path) < _PROBE_CACHE_TTL_OK:
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+        except OSError:
+            pass
+    raw = _http_get_uncached(url, timeout=timeout)
+    if cache_path is not None:
+        try:
+            _ensure_dir(os.path.dirname(cache_path))
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(raw)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"⚠ Could not write probe cache {cache_path}: {e}", file=sys.stderr)
+    return raw
+
+
+def http_get_stream(url: str, timeout: int = 60):
+    """Open *url* for streaming reads (a context-managed, file-like response).
+
+    For large downloads that are parsed as they arrive (the LODES OD file),
+    so the body is never buffered whole.  No Accept-Encoding is sent: the
+    bodies streamed here are already .gz files, and the raw bytes are what
+    the caller decompresses.  Raises urllib.error.HTTPError on HTTP errors,
+    like http_get().  With ACS_PROBE_CACHE_DIR set the body goes through
+    http_get()'s cache instead, so repeated local runs stay offline.
+    """
+    if _probe_cache_path(url, suffix='.bin') is not None:
+        return io.BytesIO(http_get(url, timeout=timeout))
+    print(f"→ GET external source  (streaming, timeout={timeout}s)", file=sys.stderr)
+    req = urllib.request.Request(url, headers={"User-Agent": _HTTP_USER_AGENT})
+    return _http_opener().open(req, timeout=timeout)
+
+
+def _http_get_uncached(url: str, timeout: int = 60) -> bytes:
     print(f"→ GET external source  (timeout={timeout}s)", file=sys.stderr)
     t0 = time.monotonic()
-    req = urllib.request.Request(url, headers={"User-Agent": "HNA-ETL/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as r:
-        raw = r.read()
-        status = r.status
+    status, reason, headers, raw = _http_request(url, timeout=timeout)
+    if not 200 <= status < 300:
+        raise urllib.error.HTTPError(url, status, reason, headers, io.BytesIO(raw))
     elapsed = time.monotonic() - t0
     print(f"← {status} OK  {len(raw):,} bytes  {elapsed:.1f}s", file=sys.stderr)
     return raw
 
 
+@functools.lru_cache(maxsize=16)
+def _field_index(fields: tuple[str, ...]) -> tuple[frozenset[str], tuple[tuple[str, str], ...]]:
+    """Return (exact-name set, ((lowercased, original), ...)) for a CSV header.
+
+    Column discovery calls pick_substr several times against the same header,
+    so the lookup structures are built once per distinct header.
+    """
+    return (frozenset(fields), tuple((f.lower(), f) for f in fields))
+
+
 def pick_substr(fields: list[str], *cands: str) -> str | None:
     """Find the first field matching any candidate by exact then case-insensitive substring.
 
     Tolerates column renames and schema drift without halting the pipeline.
     """
+    names, lowered = _field_index(tuple(fields))
     # Exact match first
     for c in cands:
-        if c in fields:
+        if c in names:
             return c
     # Case-insensitive substring match (allows minor renames)
-    fields_lower = [f.lower() for f in fields]
     for c in cands:
         cl = c.lower()
-        for i, fl in enumerate(fields_lower):
+        for fl, f in lowered:
             if cl in fl:
-                return fields[i]
+                return f
+    return None
+
+
+def _header_offset(text: str) -> int | None:
+    """Offset of the header row in *text*, skipping leading banner rows.
+
+    Heuristic: the first row with >=3 non-empty comma-separated fields that
+    contains at least one known column keyword is treated as the header.
+    Lines are scanned in place, so only header candidates are ever sliced.
+    """
+    start, n = 0, len(text)
+    while start < n:
+        end = text.find('\n', start)
+        if end < 0:
+            end = n
+        # >=3 fields need >=2 commas; cheap reject before the regex.
+        if text.count(',', start, end) >= 2 and _HEADER_KEYWORD_RE.search(text, start, end):
+            fields = [f.strip() for f in text[start:end].split(',')]
+            if len([f for f in fields if f]) >= 3:
+                return start
+        start = end + 1
     return None
 
 
@@ -302,34 +641,139 @@ def detect_header_and_reader(text: str) -> tuple[list[str], 'csv.DictReader | No
     """Detect CSV header row, skipping leading banner rows.
 
     Returns (field_names, DictReader) or ([], None) if no header found.
-    Heuristic: the first row with >=3 non-empty comma-separated fields that
-    contains at least one known column keyword is treated as the header.
     """
     if not text:
         return ([], None)
-    lines = text.splitlines()
-    for i, line in enumerate(lines):
-        fields = [f.strip() for f in line.split(',')]
-        if len([f for f in fields if f]) < 3:
-            continue
-        fields_lower = [f.lower() for f in fields]
-        if any(kw in fl for kw in ['fips', 'county', 'year', 'age', 'pop', 'hh', 'unit', 'vac'] for fl in fields_lower):
-            reader = csv.DictReader(lines[i:])
-            return (list(reader.fieldnames or []), reader)
-    return ([], None)
+    i = _header_offset(text)
+    if i is None:
+        return ([], None)
+    reader = csv.DictReader(io.StringIO(text[i:], newline=''))
+    return (list(reader.fieldnames or []), reader)
+
+
+def detect_header_and_rows(text: str) -> tuple[list[str], 'csv.reader | None']:
+    """detect_header_and_reader, but with a plain csv.reader over the data rows.
+
+    For hot loops that index a few columns by position (looked up once via
+    fieldnames.index) rather than building a DictReader dict per row.
+    Returns (field_names, reader) or ([], None) if no header found.
+    """
+    if not text:
+        return ([], None)
+    i = _header_offset(text)
+    if i is None:
+        return ([], None)
+    reader = csv.reader(io.StringIO(text[i:], newline=''))
+    return (next(reader, []), reader)
+
+
+def _write_text_cache(path: str, text: str) -> None:
+    """Atomically write *text* to *path*, gzip-compressed when it ends in .gz.
+
+    mtime=0 makes the gzip bytes depend on the text alone, so re-downloading
+    an unchanged source file leaves the committed cache byte-identical.
+    """
+    data = text.encode('utf-8')
+    if path.endswith('.gz'):
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _read_text_cache(path: str) -> str:
+    """Read a cache written by _write_text_cache."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if path.endswith('.gz'):
+        data = _gzip.decompress(data)
+    return data.decode('utf-8')
+
+
+def _validators_path(cache_path: str) -> str | None:
+    """Where fetch_csv_with_cache records the validators for *cache_path*.
+
+    Kept under HNA_BUILD_CACHE_DIR rather than next to the cache, because
+    the DOLA caches live in the committed data/hna/source.  None when that
+    setting is unset; downloads are then unconditional.
+    """
+    cache_dir = _build_cache_dir()
+    if cache_dir is None:
+        return None
+    key = hashlib.sha1(os.path.abspath(cache_path).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, 'validators', f"{os.path.basename(cache_path)}.{key}.json")
+
+
+def _file_sha1(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _cache_validators(cache_path: str, url: str) -> dict[str, str]:
+    """Conditional-GET headers for a cache written by fetch_csv_with_cache.
+
+    The ETag / Last-Modified of the response a cache was written from are
+    recorded at _validators_path() with the URL and the cache's SHA-1;
+    returns {} when the cache or record is missing or unreadable, or the
+    cache was fetched from another URL or has changed since (e.g. a pull
+    brought in a newer committed copy).
+    """
+    meta_path = _validators_path(cache_path)
+    if meta_path is None or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(meta_path, 'rb') as f:
+            meta = _json_loads(f.read())
+        if not isinstance(meta, dict) or meta.get('url') != url or meta.get('sha1') != _file_sha1(cache_path):
+            return {}
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
 
 
 def fetch_csv_with_cache(url: str, cache_path: str, label: str, timeout: int = 180) -> str | None:
     """Download a CSV, caching to disk on success; fall back to cache on failure.
 
+    A *cache_path* ending in .gz is stored gzip-compressed; the DOLA
+    caches are committed, and CSV compresses roughly 8-10x.  With
+    HNA_BUILD_CACHE_DIR set, downloads are conditional on the cached copy's
+    ETag / Last-Modified, so an unchanged source costs a 304 instead of the
+    whole file.
     Returns the CSV text, or None if both download and cache are unavailable.
     """
-    status, text = http_get_text(url, timeout=timeout, retries=3)
+    validators = _cache_validators(cache_path, url)
+    status, text, resp_headers = _http_get_text_with_headers(url, timeout=timeout, retries=3,
+                                                             headers=validators)
+    if status == 304 and validators:
+        try:
+            text = _read_text_cache(cache_path)
+        except Exception as e:
+            print(f"⚠ {label}: could not read cache {cache_path} ({e}); downloading again", file=sys.stderr)
+            status, text, resp_headers = _http_get_text_with_headers(url, timeout=timeout, retries=3)
+        else:
+            print(f"ℹ {label}: not modified; using cached file {cache_path}", file=sys.stderr)
+            return text
     if status == 200:
         try:
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            _ensure_dir(os.path.dirname(cache_path))
+            _write_text_cache(cache_path, text)
+            # Written after the cache itself, so the record never vouches
+            # for content that did not make it to disk.
+            meta_path = _validators_path(cache_path)
+            if meta_path is not None:
+                _ensure_dir(os.path.dirname(meta_path))
+                _write_json_file(meta_path, {
+                    'url': url,
+                    'sha1': _file_sha1(cache_path),
+                    'etag': resp_headers.get('ETag') if resp_headers is not None else None,
+                    'last_modified': resp_headers.get('Last-Modified') if resp_headers is not None else None,
+                })
         except Exception as e:
             print(f"⚠ Could not write cache {cache_path}: {e}", file=sys.stderr)
         return text
@@ -337,8 +781,7 @@ def fetch_csv_with_cache(url: str, cache_path: str, label: str, timeout: int = 1
     if os.path.exists(cache_path):
         print(f"ℹ {label}: download failed (HTTP {status}); using cached file {cache_path}", file=sys.stderr)
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_text_cache(cache_path)
         except Exception as e:
             print(f"⚠ {label}: could not read cache {cache_path}: {e}", file=sys.stderr)
     else:
@@ -352,13 +795,13 @@ def fetch_csv_with_cache(url: str, cache_path: str, label: str, timeout: int = 1
 
 
 def ensure_dirs():
-    os.makedirs(os.path.dirname(OUT['geo_config']), exist_ok=True)
-    os.makedirs(OUT['summary_dir'], exist_ok=True)
-    os.makedirs(OUT['lehd_dir'], exist_ok=True)
-    os.makedirs(OUT['dola_dir'], exist_ok=True)
-    os.makedirs(OUT['proj_dir'], exist_ok=True)
-    os.makedirs(OUT['derived_dir'], exist_ok=True)
-    os.makedirs(OUT['cache_dir'], exist_ok=True)
+    _ensure_dir(os.path.dirname(OUT['geo_config']))
+    _ensure_dir(OUT['summary_dir'])
+    _ensure_dir(OUT['lehd_dir'])
+    _ensure_dir(OUT['dola_dir'])
+    _ensure_dir(OUT['proj_dir'])
+    _ensure_dir(OUT['derived_dir'])
+    _ensure_dir(OUT['cache_dir'])
 
 
 import math as _math
@@ -426,12 +869,15 @@ def normalize_acs_dict(d):
     return {k: normalize_acs_value(v) for k, v in d.items()}
 
 
+_NULL_CELLS = frozenset(('', 'NA', 'null', 'None'))
+
+
 def safe_float(v):
     try:
         if v is None:
             return None
-        s = str(v).strip()
-        if s in ('', 'NA', 'null', 'None'):
+        s = (v if type(v) is str else str(v)).strip()
+        if s in _NULL_CELLS:
             return None
         f = float(s)
         if not _math.isfinite(f) or f <= ACS_SENTINEL_THRESHOLD:
@@ -449,6 +895,19 @@ def safe_int(v):
         return None
 
 
+def _csv_int(v) -> int:
+    """int(float(v)) for CSV cells, skipping the float when *v* is already integral.
+
+    DOLA files write counts and years as plain integers ("77", "2024") but
+    occasionally as "77.0"; only the latter pays for the float round-trip.
+    Raises like int(float(v)) on anything else.
+    """
+    try:
+        return int(v)
+    except ValueError:
+        return int(float(v))
+
+
 def annual_growth_rate(p0: float | None, p1: float | None, years: int) -> float | None:
     """Return annualized growth rate (CAGR) between p0 and p1."""
     try:
@@ -461,30 +920,20 @@ def annual_growth_rate(p0: float | None, p1: float | None, years: int) -> float
 
 def fetch_acs5_profile_year(year: int, geo_type: str, geoid: str, vars_: list[str]) -> tuple[dict, str]:
     """Fetch ACS 5-year profile for a given year. Returns (row_dict, url)."""
-    base = f'https://api.census.gov/data/{year}/acs/acs5/profile'
-    if geo_type == 'county':
-        for_param = f"county:{geoid[-3:]}"
-    else:
-        # Both 'place' and 'cdp' geography types use the Census 'place:' prefix;
-        # CDPs are classified as places in the Census API geography hierarchy.
-        for_param = f"place:{geoid[2:]}"
-    key = census_key()
-    # Build the query string manually to preserve literal colons in the
-    # Census API geography parameters (for= and in=).  urllib.parse.urlencode
-    # encodes ':' as '%3A', which the Census API does not decode, causing it
-    # to report "ambiguous geography" errors for county-level queries.
-    # The API key is percent-encoded separately since it may contain arbitrary
-    # characters (e.g. '+', '&', '=') that must be escaped.
-    qs = f"get={','.join(vars_)}&for={for_param}&in=state:{STATE_FIPS_CO}"
-    if key:
-        qs += f"&key={urllib.parse.quote(key, safe='')}"
-    url = f"{base}?{qs}"
-    arr = json.loads(http_get(url))
+    url = _acs_url(year, 'acs5/profile', ','.join(vars_), geo_type, geoid)
+    arr = _json_loads(http_get(url))
     header, row = arr[0], arr[1]
-    return ({header[i]: row[i] for i in range(len(header))}, url)
+    return (dict(zip(header, row)), url)
 
 
-def fetch_counties() -> list[dict]:
+@functools.lru_cache(maxsize=1)
+def _county_rows() -> tuple[tuple[str, str], ...]:
+    """(geoid, label) for every Colorado county, from TIGERweb.
+
+    geo-config, the place/CDP listings, LEHD and DOLA projections all ask
+    for the county list, so it is fetched once per run.  Raises on network
+    or parse failure (failures are not memoized).
+    """
     base = 'https://tigerweb.geo.census.gov/arcgis/rest/services/TIGERweb/State_County/MapServer/1/query'
     params = urllib.parse.urlencode({
         # TIGERweb State_County/MapServer/1 exposes the FIPS field as
@@ -499,11 +948,7 @@ def fetch_counties() -> list[dict]:
         'f': 'json'
     })
     url = f"{base}?{params}"
-    try:
-        data = json.loads(http_get(url))
-    except Exception as e:
-        print(f"⚠ fetch_counties: network unavailable ({e}); returning empty list", file=sys.stderr)
-        return []
+    data = _json_loads(http_get(url))
     out = []
     for f in data.get('features', []):
         a = f.get('attributes', {})
@@ -511,13 +956,25 @@ def fetch_counties() -> list[dict]:
         name = a.get('NAME', '')
         if geoid and name:
             label = name if name.lower().endswith('county') else f"{name} County"
-            out.append({'geoid': geoid, 'label': label})
-    return out
+            out.append((geoid, label))
+    return tuple(out)
+
+
+def fetch_counties() -> list[dict]:
+    try:
+        rows = _county_rows()
+    except Exception as e:
+        print(f"⚠ fetch_counties: network unavailable ({e}); returning empty list", file=sys.stderr)
+        return []
+    return [{'geoid': geoid, 'label': label} for geoid, label in rows]
 
 
 def build_place_geoid(place_code: str) -> str:
     """Build a 7-digit Colorado place GEOID from a 5-digit Census place code."""
-    return STATE_FIPS_CO + place_code.zfill(5)
+    # The Census API always returns 5-digit codes; only pad anything shorter.
+    if len(place_code) == 5:
+        return f"{STATE_FIPS_CO}{place_code}"
+    return f"{STATE_FIPS_CO}{place_code.zfill(5)}"
 
 
 def fetch_place_county_map(counties: list[dict]) -> dict[str, str]:
@@ -528,23 +985,25 @@ def fetch_place_county_map(counties: list[dict]) -> dict[str, str]:
     which includes the 2-digit state prefix).  For places that span multiple
     counties the county with the lowest full GEOID is recorded as primary.
     """
-    key = census_key()
     acs5_year = acs_start_year()
     place_county: dict[str, str] = {}
     # Sort counties by GEOID so multi-county places get a deterministic primary county
     sorted_counties = sorted(counties, key=lambda c: c['geoid'])
+    urls = []
     for c in sorted_counties:
         county_code = c['geoid'][2:]  # strip state prefix, get 3-digit county FIPS
         # Census API requires literal comma in geography hierarchy — build manually
         qs = f"get=NAME&for=place:*&in=state:{STATE_FIPS_CO},county:{county_code}"
-        if key:
-            qs += f"&key={urllib.parse.quote(key, safe='')}"
-        url = f"https://api.census.gov/data/{acs5_year}/acs/acs5?{qs}"
+        qs += census_key_param()
+        urls.append(f"https://api.census.gov/data/{acs5_year}/acs/acs5?{qs}")
+    # The 64 per-county queries are independent: fetch them concurrently,
+    # then merge in sorted order so the primary-county choice is unchanged.
+    responses = http_get_text_many(urls, timeout=15, retries=2)
+    for c, (status, raw) in zip(sorted_counties, responses):
         try:
-            status, raw = http_get_text(url, timeout=15, retries=2)
             if status != 200:
                 continue
-            arr = json.loads(raw)
+            arr = _json_loads(raw)
         except Exception:
             continue
         if len(arr) < 2:
@@ -563,6 +1022,47 @@ def fetch_place_county_map(counties: list[dict]) -> dict[str, str]:
     return place_county
 
 
+# CDP detection on lower-cased labels.  fetch_places drops any label with a
+# standalone "cdp" word or a trailing " (cdp)"; fetch_cdps keeps labels
+# ending " cdp" or containing "(cdp)".  _CDP_SUFFIX_RE strips the suffix
+# before the label is re-tagged " (CDP)".
+_CDP_WORD_RE = re.compile(r'(?:^|\s)cdp(?:\s|$)| \(cdp\)$')
+_CDP_LABEL_RE = re.compile(r' cdp$|\(cdp\)')
+_CDP_SUFFIX_RE = re.compile(r' (?:\(CDP\)|CDP|\(cdp\)|cdp)$')
+
+
+@functools.lru_cache(maxsize=1)
+def _state_place_rows(acs5_year: int) -> tuple[tuple[str, str], ...]:
+    """(label, place_code) for every Census place in Colorado, places and CDPs alike.
+
+    fetch_places and fetch_cdps partition this one listing, so the
+    statewide query is fetched and parsed once per run.  Raises on network
+    or parse failure (failures are not memoized).
+    """
+    # Build query string manually to preserve literal colons in Census API
+    # geography params (urlencode encodes ':' as '%3A', breaking the API).
+    qs = f"get=NAME&for=place:*&in=state:{STATE_FIPS_CO}"
+    qs += census_key_param()
+    url = f"https://api.census.gov/data/{acs5_year}/acs/acs5?{qs}"
+    arr = _json_loads(http_get(url))
+    if len(arr) < 2:
+        return ()
+    header = arr[0]
+    name_idx = header.index('NAME') if 'NAME' in header else -1
+    place_idx = header.index('place') if 'place' in header else -1
+    if name_idx < 0 or place_idx < 0:
+        return ()
+    rows = []
+    for row in arr[1:]:
+        name = row[name_idx] if name_idx < len(row) else ''
+        place_code = row[place_idx] if place_idx < len(row) else ''
+        if not name or not place_code:
+            continue
+        # Split "City Name, Colorado" → "City Name"
+        rows.append((name.split(',')[0].strip(), place_code))
+    return tuple(rows)
+
+
 def fetch_places(counties: list[dict] | None = None,
                  place_county: dict[str, str] | None = None) -> list[dict]:
     """Fetch all incorporated places (municipalities) in Colorado from Census API.
@@ -571,26 +1071,12 @@ def fetch_places(counties: list[dict] | None = None,
     incorporated places (cities, towns) in Colorado, with containingCounty
     populated for each place via county-level queries.
     """
-    key = census_key()
-    acs5_year = acs_start_year()
-    # Build query string manually to preserve literal colons in Census API
-    # geography params (urlencode encodes ':' as '%3A', breaking the API).
-    qs = f"get=NAME&for=place:*&in=state:{STATE_FIPS_CO}"
-    if key:
-        qs += f"&key={urllib.parse.quote(key, safe='')}"
-    url = f"https://api.census.gov/data/{acs5_year}/acs/acs5?{qs}"
     try:
-        raw = http_get(url)
-        arr = json.loads(raw)
+        rows = _state_place_rows(acs_start_year())
     except Exception as e:
         print(f"⚠ fetch_places: unavailable ({e}); returning empty list", file=sys.stderr)
         return []
-    if len(arr) < 2:
-        return []
-    header = arr[0]
-    name_idx = header.index('NAME') if 'NAME' in header else -1
-    place_idx = header.index('place') if 'place' in header else -1
-    if name_idx < 0 or place_idx < 0:
+    if not rows:
         return []
     # Build place→county map so every entry gets a containingCounty
     if place_county is None:
@@ -598,17 +1084,10 @@ def fetch_places(counties: list[dict] | None = None,
             counties = fetch_counties()
         place_county = fetch_place_county_map(counties) if counties else {}
     out = []
-    cdp_suffixes = (' cdp', ' (cdp)')
-    for row in arr[1:]:
-        name = row[name_idx] if name_idx < len(row) else ''
-        place_code = row[place_idx] if place_idx < len(row) else ''
-        if not name or not place_code:
-            continue
-        # Split "City Name, Colorado" → "City Name"
-        label = name.split(',')[0].strip()
+    for label, place_code in rows:
         # Skip CDPs (they will be in fetch_cdps)
         label_lower = label.lower()
-        if any(label_lower.endswith(s) for s in cdp_suffixes) or 'cdp' in label_lower.split():
+        if _CDP_WORD_RE.search(label_lower):
             continue
         geoid = build_place_geoid(place_code)
         entry: dict = {'type': 'place', 'geoid': geoid, 'label': label}
@@ -624,26 +1103,12 @@ def fetch_cdps(counties: list[dict] | None = None,
                place_county: dict[str, str] | None = None) -> list[dict]:
     """Fetch all Census-Designated Places (CDPs) in Colorado from Census API,
     with containingCounty populated for each CDP via county-level queries."""
-    key = census_key()
-    acs5_year = acs_start_year()
-    # Build query string manually to preserve literal colons in Census API
-    # geography params (urlencode encodes ':' as '%3A', breaking the API).
-    qs = f"get=NAME&for=place:*&in=state:{STATE_FIPS_CO}"
-    if key:
-        qs += f"&key={urllib.parse.quote(key, safe='')}"
-    url = f"https://api.census.gov/data/{acs5_year}/acs/acs5?{qs}"
     try:
-        raw = http_get(url)
-        arr = json.loads(raw)
+        rows = _state_place_rows(acs_start_year())
     except Exception as e:
         print(f"⚠ fetch_cdps: unavailable ({e}); returning empty list", file=sys.stderr)
         return []
-    if len(arr) < 2:
-        return []
-    header = arr[0]
-    name_idx = header.index('NAME') if 'NAME' in header else -1
-    place_idx = header.index('place') if 'place' in header else -1
-    if name_idx < 0 or place_idx < 0:
+    if not rows:
         return []
     # Reuse place→county map (CDPs appear in the same Census place query)
     if place_county is None:
@@ -651,22 +1116,15 @@ def fetch_cdps(counties: list[dict] | None = None,
             counties = fetch_counties()
         place_county = fetch_place_county_map(counties) if counties else {}
     out = []
-    for row in arr[1:]:
-        name = row[name_idx] if name_idx < len(row) else ''
-        place_code = row[place_idx] if place_idx < len(row) else ''
-        if not name or not place_code:
-            continue
-        label = name.split(',')[0].strip()
+    for label, place_code in rows:
         label_lower = label.lower()
         # Only include CDPs
-        if not (any(label_lower.endswith(s) for s in (' cdp', ' (cdp)')) or
-                '(cdp)' in label_lower):
+        if not _CDP_LABEL_RE.search(label_lower):
             continue
         # Normalise label: strip trailing " CDP" / "(CDP)"
-        for suffix in [' (CDP)', ' CDP', ' (cdp)', ' cdp']:
-            if label.endswith(suffix):
-                label = label[:-len(suffix)].strip() + ' (CDP)'
-                break
+        label, n_sub = _CDP_SUFFIX_RE.subn('', label)
+        if n_sub:
+            label = label.strip() + ' (CDP)'
         geoid = build_place_geoid(place_code)
         entry: dict = {'type': 'cdp', 'geoid': geoid, 'label': label}
         county_fips = place_county.get(geoid)
@@ -677,15 +1135,269 @@ def fetch_cdps(counties: list[dict] | None = None,
     return out
 
 
+@functools.cache
 def census_key() -> str:
+    # Read once per process; every ACS URL builder calls this.
     return os.environ.get('CENSUS_API_KEY', '').strip()
 
 
+@functools.cache
+def census_key_param() -> str:
+    """The ``&key=...`` query suffix for Census API URLs ('' without a key).
+
+    Built once per process.  The key is percent-encoded since it may
+    contain characters such as '+', '&' or '=' that must be escaped.
+    """
+    key = census_key()
+    return f"&key={urllib.parse.quote(key, safe='')}" if key else ''
+
+
+@functools.lru_cache(maxsize=1024)
+def _acs_geo_params(geo_type: str, geoid: str) -> str:
+    """The ``&for=...&in=...&key=...`` tail of an ACS query for one geography.
+
+    Counties query county:NNN, places and CDPs query place:NNNNN (CDPs are
+    places in the Census API hierarchy); anything else is the whole state.
+    The query string is built by hand to keep literal colons in for=/in=:
+    urllib.parse.urlencode encodes ':' as '%3A', which the Census API does
+    not decode, causing "ambiguous geography" errors for county queries.
+    """
+    if geo_type == 'county':
+        geo = f"&for=county:{geoid[-3:]}&in=state:{STATE_FIPS_CO}"
+    elif geo_type in ('place', 'cdp'):
+        geo = f"&for=place:{geoid[2:]}&in=state:{STATE_FIPS_CO}"
+    else:
+        geo = f"&for=state:{STATE_FIPS_CO}"
+    return geo + census_key_param()
+
+
+def _acs_url(year: int, path: str, get: str, geo_type: str, geoid: str) -> str:
+    """Census API URL for ACS *path* (e.g. 'acs1/profile', 'acs5') and *year*."""
+    return f"https://api.census.gov/data/{year}/acs/{path}?get={get}{_acs_geo_params(geo_type, geoid)}"
+
+
+@functools.cache
 def acs_start_year() -> int:
     """Return the primary ACS data year to target (configurable via ACS_START_YEAR env var)."""
     return int(os.environ.get('ACS_START_YEAR', '2024'))
 
 
+@functools.cache
+def acs_years_to_try() -> tuple[int, ...]:
+    """ACS years to try, newest first: ACS_START_YEAR down over ACS_FALLBACK_YEARS.
+
+    Read once per process; every ACS fetcher walks this window per geography.
+    """
+    start_year = acs_start_year()
+    n_fallback = int(os.environ.get('ACS_FALLBACK_YEARS', '3'))
+    return tuple(range(start_year, start_year - n_fallback, -1))
+
+
+def _once(cache: dict, lock: threading.Lock, key, compute):
+    """Return compute() for *key*, running it at most once across threads.
+
+    *cache* maps keys to Futures: the first caller for a key computes the
+    value outside *lock* and the rest wait on its Future, so concurrent
+    first calls cost one request and other keys are not held up.  A raised
+    exception is not memoized; a later caller computes again.
+    """
+    with lock:
+        future = cache.get(key)
+        owner = future is None
+        if owner:
+            future = cache[key] = Future()
+    if owner:
+        try:
+            future.set_result(compute())
+        except BaseException as e:
+            with lock:
+                cache.pop(key, None)
+            future.set_exception(e)
+            raise
+    return future.result()
+
+
+# Vintage probe results, keyed by (year, series, endpoint); see _once().
+_ACS_VINTAGES: dict[tuple[int, str, str], 'Future[bool]'] = {}
+_ACS_VINTAGES_LOCK = threading.Lock()
+
+
+def _acs_vintage_published(year: int, series: str, endpoint: str = '') -> bool:
+    """Whether the Census API serves *series*/*endpoint* for ACS *year* at all.
+
+    Probed once per run with a one-variable statewide query.  When the newest
+    vintage has not been released yet every per-geography request to it
+    404s, so the fallback ladders skip it instead of paying for those misses
+    on each geography.  Only a 404 counts as "not published"; network errors
+    and 5xx keep the vintage in play so per-geography fetches can retry.
+    """
+    return _once(_ACS_VINTAGES, _ACS_VINTAGES_LOCK, (year, series, endpoint),
+                 lambda: _probe_acs_vintage(year, series, endpoint))
+
+
+def _probe_acs_vintage(year: int, series: str, endpoint: str) -> bool:
+    qs = f"get=NAME&for=state:{STATE_FIPS_CO}"
+    qs += census_key_param()
+    path = f"{series}/{endpoint}" if endpoint else series
+    status, _ = http_get_json_with_status(f"https://api.census.gov/data/{year}/acs/{path}?{qs}")
+    if status == 404:
+        print(f"ℹ ACS {year} {path} not published; skipping it in fallback ladders", file=sys.stderr)
+        return False
+    return True
+
+
+# Rows from statewide wildcard queries (for=county:* / for=place:*), keyed by
+# (year, dataset path, get= list, geography kind).  build_summary_cache
+# fetches every county, place and CDP, so one wildcard request per vintage
+# replaces hundreds of single-geography requests.  Entries are Futures; see
+# _once().
+_ACS_STATEWIDE_ROWS: dict[tuple[int, str, str, str], 'Future[dict[str, dict] | None]'] = {}
+_ACS_STATEWIDE_LOCK = threading.Lock()
+
+
+def _fetch_acs_statewide_rows(year: int, path: str, get: str, kind: str) -> dict[str, dict] | None:
+    """{geoid: row} from one statewide wildcard ACS query, or None on failure."""
+    qs = f"get={get}&for={kind}:*&in=state:{STATE_FIPS_CO}"
+    qs += census_key_param()
+    result = http_get_json(f"https://api.census.gov/data/{year}/acs/{path}?{qs}")
+    if not (isinstance(result, list) and result and kind in result[0]):
+        return None
+    header = result[0]
+    idx = header.index(kind)
+    return {STATE_FIPS_CO + row[idx]: dict(zip(header, row))
+            for row in result[1:] if idx < len(row)}
+
+
+def _acs_statewide_row(year: int, path: str, get: str,
+                       geo_type: str, geoid: str) -> tuple[bool, dict | None]:
+    """Look up one geography in the statewide ACS query for *year*/*path*.
+
+    Returns (resolved, row).  resolved is False when the wildcard query
+    failed, in which case the caller should issue its own single-geography
+    request; otherwise row is a fresh {var: value} dict, or None when the
+    vintage has no estimate for this geography.
+    """
+    kind = 'county' if geo_type == 'county' else 'place'
+    # Summary workers walk the same ladder in step: the first to ask for a
+    # wildcard fetches it and the rest wait on its result.
+    rows = _once(_ACS_STATEWIDE_ROWS, _ACS_STATEWIDE_LOCK, (year, path, get, kind),
+                 lambda: _fetch_acs_statewide_rows(year, path, get, kind))
+    if rows is None:
+        return (False, None)
+    row = rows.get(geoid)
+    return (True, dict(row) if row is not None else None)
+
+
+def _fetch_acs_row(year: int, path: str, get: str, geo_type: str, geoid: str,
+                   statewide: bool = False) -> dict | None:
+    """One rung of an ACS fallback ladder: {var: value} for a geography, or None.
+
+    Skips vintages the API has not published.  With *statewide*, counties,
+    places and CDPs are answered from the memoized wildcard query, and a
+    single-geography request is only sent if that query failed.
+    """
+    series, _, endpoint = path.partition('/')
+    if not _acs_vintage_published(year, series, endpoint):
+        return None
+    if statewide and geo_type in ('county', 'place', 'cdp'):
+        resolved, row = _acs_statewide_row(year, path, get, geo_type, geoid)
+        if resolved:
+            return row
+    result = http_get_json(_acs_url(year, path, get, geo_type, geoid))
+    if result and len(result) > 1:
+        return dict(zip(result[0], result[1]))
+    return None
+
+
+# B-series variables available via ACS 5-year for all geographies, used by
+# _fetch_acs5_b_series.  The get= list is joined once at import.
+_ACS5_B_VARS = (
+    'B01003_001E',  # total population           → DP05_0001E
+    'B11001_001E',  # total households            → DP02_0001E
+    'B19013_001E',  # median household income     → DP03_0062E
+    'B25001_001E',  # total housing units         → DP04_0001E
+    'B25003_001E',  # occupied housing units total
+    'B25003_002E',  # owner-occupied              → DP04_0046PE (%)
+    'B25003_003E',  # renter-occupied             → DP04_0047PE (%)
+    'B25077_001E',  # median home value           → DP04_0089E
+    'B25064_001E',  # median gross rent           → DP04_0134E
+    # Structure by units in building              → DP04_0003E–0010E
+    'B25024_002E',  # 1-unit detached
+    'B25024_003E',  # 1-unit attached
+    'B25024_004E',  # 2 units
+    'B25024_005E',  # 3–4 units
+    'B25024_006E',  # 5–9 units
+    'B25024_007E',  # 10–19 units
+    'B25024_008E',  # 20–49 units
+    'B25024_009E',  # 50+ units
+    'B25024_010E',  # mobile home
+    # GRAPI rent burden                           → DP04_0142PE–0146PE
+    'B25070_001E',  # renter-occupied paying rent (GRAPI denominator)
+    'B25070_006E',  # 25.0–29.9 percent
+    'B25070_007E',  # 30.0–34.9 percent          → DP04_0145PE
+    'B25070_008E',  # 35.0–39.9 percent
+    'B25070_009E',  # 40.0–49.9 percent
+    'B25070_010E',  # 50.0 percent or more
+    # SMOCAPI owner cost burden (housing units with a mortgage)
+    # → mapped to DP04_0111PE–DP04_0115PE for renderOwnerCostBurdenChart.
+    # B25091 layout verified against
+    #   https://api.census.gov/data/2023/acs/acs5/groups/B25091.json
+    # Earlier code mis-assumed B25091_001E was the with-mortgage subtotal
+    # and that _007E…_011E were the 5 DP-profile bins. They aren't:
+    #   _001E = grand total (with + without mortgage)
+    #   _002E = with-mortgage subtotal (real SMOCAPI denominator)
+    #   _003E <10%   _004E 10–14.9%   _005E 15–19.9%   → DP04_0111PE (<20%)
+    #   _006E 20–24.9%                                 → DP04_0112PE
+    #   _007E 25–29.9%                                 → DP04_0113PE
+    #   _008E 30–34.9%                                 → DP04_0114PE
+    #   _009E 35–39.9%  _010E 40–49.9%  _011E ≥50%     → DP04_0115PE (≥35%)
+    'B25091_002E',  # with-mortgage subtotal (SMOCAPI denominator)
+    'B25091_003E', 'B25091_004E', 'B25091_005E',  # bins summing to <20%
+    'B25091_006E',  # 20.0–24.9 percent
+    'B25091_007E',  # 25.0–29.9 percent
+    'B25091_008E',  # 30.0–34.9 percent
+    'B25091_009E', 'B25091_010E', 'B25091_011E',  # bins summing to ≥35%
+    'NAME',
+)
+_ACS5_B_GET = ','.join(_ACS5_B_VARS)
+
+# Output fields of _fetch_acs5_b_series in emitted order, paired with the
+# B-series variable each is copied from.  Fields paired with None are
+# percentages/aggregates filled in per call.
+_ACS5_B_TO_DP = (
+    ('DP05_0001E', 'B01003_001E'),
+    ('DP02_0001E', 'B11001_001E'),
+    ('DP03_0062E', 'B19013_001E'),
+    ('DP04_0001E', 'B25001_001E'),
+    # Tenure — ACS 2023 correct orientation: DP04_0046PE=owner %, DP04_0047PE=renter %
+    ('DP04_0046PE', None),
+    ('DP04_0047PE', None),
+    ('DP04_0046E', 'B25003_002E'),   # owner HH count
+    ('DP04_0047E', 'B25003_003E'),   # renter HH count (used by Housing Gap panel)
+    ('DP04_0089E', 'B25077_001E'),
+    ('DP04_0134E', 'B25064_001E'),
+    # Structure type — ACS 2023 codes: DP04_0007E=1-unit detached … DP04_0014E=mobile home
+    # (In older ACS this section started at DP04_0003E; it shifted to DP04_0007E in 2023)
+    ('DP04_0007E', 'B25024_002E'),   # 1-unit detached
+    ('DP04_0008E', 'B25024_003E'),   # 1-unit attached
+    ('DP04_0009E', 'B25024_004E'),   # 2 units
+    ('DP04_0010E', 'B25024_005E'),   # 3-4 units
+    ('DP04_0011E', 'B25024_006E'),   # 5-9 units
+    ('DP04_0012E', 'B25024_007E'),   # 10-19 units
+    ('DP04_0013E', None),            # 20+ units
+    ('DP04_0014E', 'B25024_010E'),   # mobile home
+    ('DP04_0136PE', None),
+    ('DP04_0141PE', None),
+    ('DP04_0142PE', None),
+    ('DP04_0111PE', None),
+    ('DP04_0112PE', None),
+    ('DP04_0113PE', None),
+    ('DP04_0114PE', None),
+    ('DP04_0115PE', None),
+    ('NAME', 'NAME'),
+)
+
+
 def _fetch_acs5_b_series(geo_type: str, geoid: str) -> dict | None:
     """Fetch ACS 5-year B-series data for any geography type.
 
@@ -694,82 +1406,12 @@ def _fetch_acs5_b_series(geo_type: str, geoid: str) -> dict | None:
     stable across ACS releases than DP profile variables.  Results are mapped
     to DP-series variable names for compatibility with the UI.
     """
-    # B-series variables available via ACS 5-year for all geographies
-    b_vars = [
-        'B01003_001E',  # total population           → DP05_0001E
-        'B11001_001E',  # total households            → DP02_0001E
-        'B19013_001E',  # median household income     → DP03_0062E
-        'B25001_001E',  # total housing units         → DP04_0001E
-        'B25003_001E',  # occupied housing units total
-        'B25003_002E',  # owner-occupied              → DP04_0046PE (%)
-        'B25003_003E',  # renter-occupied             → DP04_0047PE (%)
-        'B25077_001E',  # median home value           → DP04_0089E
-        'B25064_001E',  # median gross rent           → DP04_0134E
-        # Structure by units in building              → DP04_0003E–0010E
-        'B25024_002E',  # 1-unit detached
-        'B25024_003E',  # 1-unit attached
-        'B25024_004E',  # 2 units
-        'B25024_005E',  # 3–4 units
-        'B25024_006E',  # 5–9 units
-        'B25024_007E',  # 10–19 units
-        'B25024_008E',  # 20–49 units
-        'B25024_009E',  # 50+ units
-        'B25024_010E',  # mobile home
-        # GRAPI rent burden                           → DP04_0142PE–0146PE
-        'B25070_001E',  # renter-occupied paying rent (GRAPI denominator)
-        'B25070_006E',  # 25.0–29.9 percent
-        'B25070_007E',  # 30.0–34.9 percent          → DP04_0145PE
-        'B25070_008E',  # 35.0–39.9 percent
-        'B25070_009E',  # 40.0–49.9 percent
-        'B25070_010E',  # 50.0 percent or more
-        # SMOCAPI owner cost burden (housing units with a mortgage)
-        # → mapped to DP04_0111PE–DP04_0115PE for renderOwnerCostBurdenChart.
-        # B25091 layout verified against
-        #   https://api.census.gov/data/2023/acs/acs5/groups/B25091.json
-        # Earlier code mis-assumed B25091_001E was the with-mortgage subtotal
-        # and that _007E…_011E were the 5 DP-profile bins. They aren't:
-        #   _001E = grand total (with + without mortgage)
-        #   _002E = with-mortgage subtotal (real SMOCAPI denominator)
-        #   _003E <10%   _004E 10–14.9%   _005E 15–19.9%   → DP04_0111PE (<20%)
-        #   _006E 20–24.9%                                 → DP04_0112PE
-        #   _007E 25–29.9%                                 → DP04_0113PE
-        #   _008E 30–34.9%                                 → DP04_0114PE
-        #   _009E 35–39.9%  _010E 40–49.9%  _011E ≥50%     → DP04_0115PE (≥35%)
-        'B25091_002E',  # with-mortgage subtotal (SMOCAPI denominator)
-        'B25091_003E', 'B25091_004E', 'B25091_005E',  # bins summing to <20%
-        'B25091_006E',  # 20.0–24.9 percent
-        'B25091_007E',  # 25.0–29.9 percent
-        'B25091_008E',  # 30.0–34.9 percent
-        'B25091_009E', 'B25091_010E', 'B25091_011E',  # bins summing to ≥35%
-        'NAME',
-    ]
-
-    place_code = geoid[2:]  # strip 2-digit state prefix
-    key = census_key()
-
-    # Build geography parameters based on geo_type
-    if geo_type == 'county':
-        for_param = f"county:{geoid[-3:]}"
-    else:
-        for_param = f"place:{place_code}"
-
-    start_year = acs_start_year()
-    n_fallback = int(os.environ.get('ACS_FALLBACK_YEARS', '3'))
-    years_to_try = list(range(start_year, start_year - n_fallback, -1))
+    years_to_try = acs_years_to_try()
 
     for year in years_to_try:
-        base = f'https://api.census.gov/data/{year}/acs/acs5'
-        # Build the query string manually to preserve literal colons in the
-        # Census API geography parameters (for= and in=).  urllib.parse.urlencode
-        # encodes ':' as '%3A', which the Census API does not decode, causing it
-        # to report "ambiguous geography" errors for county-level queries.
-        qs = f"get={','.join(b_vars)}&for={for_param}&in=state:{STATE_FIPS_CO}"
-        if key:
-            qs += f"&key={urllib.parse.quote(key, safe='')}"
-        url = f"{base}?{qs}"
-        result = http_get_json(url)
+        result = http_get_json(_acs_url(year, 'acs5', _ACS5_B_GET, geo_type, geoid))
         if result and len(result) > 1:
-            raw = {result[0][i]: result[1][i] for i in range(len(result[0]))}
+            raw = dict(zip(result[0], result[1]))
             print(f"ℹ {geo_type}:{geoid}: resolved via ACS5 B-series year={year}", file=sys.stderr)
 
             def si(v):
@@ -843,28 +1485,12 @@ def _fetch_acs5_b_series(geo_type: str, geoid: str) -> dict | None:
                     return None
                 return round(n / smocapi_tot * 100, 1)
 
-            mapped = {
-                'DP05_0001E': raw.get('B01003_001E'),
-                'DP02_0001E': raw.get('B11001_001E'),
-                'DP03_0062E': raw.get('B19013_001E'),
-                'DP04_0001E': raw.get('B25001_001E'),
-                # Tenure — ACS 2023 correct orientation: DP04_0046PE=owner %, DP04_0047PE=renter %
+            # update() keeps each computed field in its _ACS5_B_TO_DP slot.
+            mapped = {dp: raw.get(b) if b else None for dp, b in _ACS5_B_TO_DP}
+            mapped.update({
                 'DP04_0046PE': str(owner_pct) if owner_pct is not None else None,
                 'DP04_0047PE': str(renter_pct) if renter_pct is not None else None,
-                'DP04_0046E': raw.get('B25003_002E'),   # owner HH count
-                'DP04_0047E': raw.get('B25003_003E'),   # renter HH count (used by Housing Gap panel)
-                'DP04_0089E': raw.get('B25077_001E'),
-                'DP04_0134E': raw.get('B25064_001E'),
-                # Structure type — ACS 2023 codes: DP04_0007E=1-unit detached … DP04_0014E=mobile home
-                # (In older ACS this section started at DP04_0003E; it shifted to DP04_0007E in 2023)
-                'DP04_0007E': raw.get('B25024_002E'),   # 1-unit detached
-                'DP04_0008E': raw.get('B25024_003E'),   # 1-unit attached
-                'DP04_0009E': raw.get('B25024_004E'),   # 2 units
-                'DP04_0010E': raw.get('B25024_005E'),   # 3-4 units
-                'DP04_0011E': raw.get('B25024_006E'),   # 5-9 units
-                'DP04_0012E': raw.get('B25024_007E'),   # 10-19 units
                 'DP04_0013E': str(units_20p) if units_20p is not None else None,  # 20+ units
-                'DP04_0014E': raw.get('B25024_010E'),   # mobile home
                 # GRAPI — store pre-computed ≥30% in DP04_0136PE slot (frontend reads this as cost-burdened %)
                 # DP04_0141PE = 30–34.9% bin, DP04_0142PE = 35%+ bin
                 'DP04_0136PE': str(grapi_pct(burden30_plus)) if grapi_tot else None,   # ≥30% burdened
@@ -876,18 +1502,21 @@ def _fetch_acs5_b_series(geo_type: str, geoid: str) -> dict | None:
                 'DP04_0113PE': str(smocapi_pct(owner_25_30)) if owner_25_30 is not None else None,  # 25–30%
                 'DP04_0114PE': str(smocapi_pct(owner_30_35)) if owner_30_35 is not None else None,  # 30–35%
                 'DP04_0115PE': str(smocapi_pct(owner_35p))   if owner_35p   is not None else None,  # 35%+
-                'NAME': raw.get('NAME'),
-            }
+            })
             return mapped
 
     print(f"⚠ {geo_type}:{geoid}: ACS5 B-series also failed (tried years {years_to_try})", file=sys.stderr)
     return None
 
 
-def fetch_acs_profile(geo_type: str, geoid: str) -> dict | None:
+def fetch_acs_profile(geo_type: str, geoid: str, statewide: bool = False) -> dict | None:
     """Fetch ACS profile with fallback chain: ACS1/profile → ACS5/profile.
     For CDPs, adds ACS 5-year B-series as a final fallback.
 
+    With *statewide* set, each rung is answered from one memoized
+    for=county:* / for=place:* query (see _acs_statewide_row) and a
+    single-geography request is only sent if that query fails.
+
     ACS variable code notes (verified against ACS 5-year 2023 variable list):
     - DP04_0046PE = Owner-occupied %  (DP04_0047PE = Renter-occupied %)
     - Structure type starts at DP04_0007E in ACS 2023 (older years had it at DP04_0003E)
@@ -979,43 +1608,24 @@ def fetch_acs_profile(geo_type: str, geoid: str) -> dict | None:
     # that still grep "vars_" — concatenated only after all batches run.
     vars_ = vars_a + [v for batch in (vars_b, vars_c, vars_d) for v in batch if v not in vars_a]
 
-    def build_url(year: int, endpoint: str, series: str, batch_vars: list[str]) -> str:
-        base = f'https://api.census.gov/data/{year}/acs/{series}/{endpoint}'
-        if geo_type == 'county':
-            for_ = f"county:{geoid[-3:]}"
-        elif geo_type == 'place':
-            for_ = f"place:{geoid[2:]}"
-        else:
-            for_ = f"place:{geoid[2:]}"
-        key = census_key()
-        # Build the query string manually to preserve literal colons in the
-        # Census API geography parameters (for= and in=).  urllib.parse.urlencode
-        # encodes ':' as '%3A', which the Census API does not decode, causing it
-        # to report "ambiguous geography" errors for county-level queries.
-        qs = f"get={','.join(batch_vars)}&for={for_}&in=state:{STATE_FIPS_CO}"
-        if key:
-            qs += f"&key={urllib.parse.quote(key, safe='')}"
-        return f"{base}?{qs}"
-
     def _fetch_batch(batch_vars: list[str]) -> dict | None:
         """Try ACS1/profile → ACS5/profile for each year in the fallback window.
         Returns a {var: value} dict on first success, None if all attempts fail."""
+        get = ','.join(batch_vars)
         for year in years_to_try:
-            for series, endpoint in [('acs1', 'profile'), ('acs5', 'profile')]:
-                url = build_url(year, endpoint, series, batch_vars)
-                result = http_get_json(url)
-                if result and len(result) > 1:
+            for path in ('acs1/profile', 'acs5/profile'):
+                data = _fetch_acs_row(year, path, get, geo_type, geoid, statewide)
+                if data is not None:
                     if year != start_year:
-                        print(f"ℹ ACS profile {geo_type}:{geoid} batch resolved via {series}/{endpoint} year={year}", file=sys.stderr)
-                    return {result[0][i]: result[1][i] for i in range(len(result[0]))}
+                        print(f"ℹ ACS profile {geo_type}:{geoid} batch resolved via {path} year={year}", file=sys.stderr)
+                    return data
         return None
 
     # Try each year from ACS_START_YEAR down, over ACS_FALLBACK_YEARS years;
     # for each year try ACS1/profile → ACS5/profile in order.
     # Years and depth are configurable via env vars for easy maintenance.
     start_year = acs_start_year()
-    n_fallback = int(os.environ.get('ACS_FALLBACK_YEARS', '3'))
-    years_to_try = list(range(start_year, start_year - n_fallback, -1))
+    years_to_try = acs_years_to_try()
 
     # Batch A is the historical mandatory set; without it we can't build a
     # useful summary at all. Batch B is the income / housing-age / bedroom-
@@ -1063,62 +1673,44 @@ def fetch_acs_profile(geo_type: str, geoid: str) -> dict | None:
     return merged
 
 
-def fetch_acs_s0801(geo_type: str, geoid: str) -> dict | None:
-    """Fetch ACS S0801 with fallback: ACS1/subject → ACS5/subject."""
-    vars_ = [
-        'S0801_C01_001E',  # Workers 16+ (count)
-        'S0801_C01_002E',  # Car/truck/van total parent (drove-alone + carpooled, %)
-        'S0801_C01_003E',  # Drove alone (%)
-        'S0801_C01_004E',  # Carpooled (%)
-        'S0801_C01_005E',  # Public transit (%)
-        'S0801_C01_006E',  # Walked (%)
-        'S0801_C01_007E',  # Taxicab, motorcycle, bicycle, or other means (%)
-        'S0801_C01_008E',  # Worked at home (%)
-        'S0801_C01_046E',  # Mean travel time to work (minutes)
-        'NAME'
-    ]
+_ACS_S0801_VARS = (
+    'S0801_C01_001E',  # Workers 16+ (count)
+    'S0801_C01_002E',  # Car/truck/van total parent (drove-alone + carpooled, %)
+    'S0801_C01_003E',  # Drove alone (%)
+    'S0801_C01_004E',  # Carpooled (%)
+    'S0801_C01_005E',  # Public transit (%)
+    'S0801_C01_006E',  # Walked (%)
+    'S0801_C01_007E',  # Taxicab, motorcycle, bicycle, or other means (%)
+    'S0801_C01_008E',  # Worked at home (%)
+    'S0801_C01_046E',  # Mean travel time to work (minutes)
+    'NAME'
+)
+_ACS_S0801_GET = ','.join(_ACS_S0801_VARS)
 
-    def build_url(year: int, endpoint: str, series: str = 'acs1') -> str:
-        base = f'https://api.census.gov/data/{year}/acs/{series}/{endpoint}'
-        if geo_type == 'county':
-            for_ = f"county:{geoid[-3:]}"
-        elif geo_type == 'place':
-            for_ = f"place:{geoid[2:]}"
-        else:
-            for_ = f"place:{geoid[2:]}"
-        key = census_key()
-        # Build the query string manually to preserve literal colons in the
-        # Census API geography parameters (for= and in=).  urllib.parse.urlencode
-        # encodes ':' as '%3A', which the Census API does not decode, causing it
-        # to report "ambiguous geography" errors for county-level queries.
-        qs = f"get={','.join(vars_)}&for={for_}&in=state:{STATE_FIPS_CO}"
-        if key:
-            qs += f"&key={urllib.parse.quote(key, safe='')}"
-        return f"{base}?{qs}"
 
+def fetch_acs_s0801(geo_type: str, geoid: str, statewide: bool = False) -> dict | None:
+    """Fetch ACS S0801 with fallback: ACS1/subject → ACS5/subject.
+
+    *statewide* behaves as in fetch_acs_profile.
+    """
     # Try ACS1/subject → ACS5/subject for each year
     # Years are configurable: ACS_START_YEAR (default 2024), ACS_FALLBACK_YEARS (default 3)
     start_year = acs_start_year()
-    n_fallback = int(os.environ.get('ACS_FALLBACK_YEARS', '3'))
-    years_to_try = list(range(start_year, start_year - n_fallback, -1))
+    years_to_try = acs_years_to_try()
 
     for year in years_to_try:
-        url = build_url(year, 'subject', 'acs1')
-        result = http_get_json(url)
-        if result and len(result) > 1:
+        data = _fetch_acs_row(year, 'acs1/subject', _ACS_S0801_GET, geo_type, geoid, statewide)
+        if data is not None:
             if year != start_year:
                 print(f"ℹ Using ACS1/subject {year} for {geo_type}:{geoid}", file=sys.stderr)
-            data = {result[0][i]: result[1][i] for i in range(len(result[0]))}
             # Record which vintage and series were actually used (commuting reliability).
             data['_acsYear'] = year
             data['_acsSeries'] = 'acs1'
             return data
 
-        url = build_url(year, 'subject', 'acs5')
         print(f"ℹ Falling back to ACS5/subject {year} for {geo_type}:{geoid}", file=sys.stderr)
-        result = http_get_json(url)
-        if result and len(result) > 1:
-            data = {result[0][i]: result[1][i] for i in range(len(result[0]))}
+        data = _fetch_acs_row(year, 'acs5/subject', _ACS_S0801_GET, geo_type, geoid, statewide)
+        if data is not None:
             data['_acsYear'] = year
             data['_acsSeries'] = 'acs5'
             return data
@@ -1127,64 +1719,45 @@ def fetch_acs_s0801(geo_type: str, geoid: str) -> dict | None:
     return None
 
 
-def fetch_acs_b08301(geo_type: str, geoid: str) -> dict | None:
+# B08301 variable mapping:
+#   B08301_001E – Total workers 16+
+#   B08301_003E – Drove alone
+#   B08301_004E – Carpooled
+#   B08301_010E – Public transit (excl. taxicab)
+#   B08301_018E – Bicycle
+#   B08301_019E – Walked
+#   B08301_020E – Taxicab / motorcycle / other means
+#   B08301_021E – Worked from home
+_ACS_B08301_VARS = (
+    'B08301_001E',  # Total
+    'B08301_003E',  # Drove alone
+    'B08301_004E',  # Carpooled
+    'B08301_010E',  # Public transit
+    'B08301_018E',  # Bicycle
+    'B08301_019E',  # Walked
+    'B08301_020E',  # Taxicab / motorcycle / other
+    'B08301_021E',  # Worked from home
+    'NAME',
+)
+_ACS_B08301_GET = ','.join(_ACS_B08301_VARS)
+
+
+def fetch_acs_b08301(geo_type: str, geoid: str, statewide: bool = False) -> dict | None:
     """Fetch ACS B08301 (Means of Transportation to Work) with ACS1→ACS5 fallback.
 
+    *statewide* behaves as in fetch_acs_profile (counties, places and CDPs).
+
     Returns a normalised dict with keys:
         drive, carpool, transit, walk, bike, work_from_home, other, total
     All values are integer worker counts.
     """
-    # B08301 variable mapping:
-    #   B08301_001E – Total workers 16+
-    #   B08301_003E – Drove alone
-    #   B08301_004E – Carpooled
-    #   B08301_010E – Public transit (excl. taxicab)
-    #   B08301_018E – Bicycle
-    #   B08301_019E – Walked
-    #   B08301_020E – Taxicab / motorcycle / other means
-    #   B08301_021E – Worked from home
-    vars_ = [
-        'B08301_001E',  # Total
-        'B08301_003E',  # Drove alone
-        'B08301_004E',  # Carpooled
-        'B08301_010E',  # Public transit
-        'B08301_018E',  # Bicycle
-        'B08301_019E',  # Walked
-        'B08301_020E',  # Taxicab / motorcycle / other
-        'B08301_021E',  # Worked from home
-        'NAME',
-    ]
-
-    def build_url(year: int, series: str = 'acs1') -> str:
-        base = f'https://api.census.gov/data/{year}/acs/{series}'
-        if geo_type == 'county':
-            for_ = f"county:{geoid[-3:]}"
-            in_ = f"state:{STATE_FIPS_CO}"
-        elif geo_type in ('place', 'cdp'):
-            for_ = f"place:{geoid[2:]}"
-            in_ = f"state:{STATE_FIPS_CO}"
-        else:
-            for_ = f"state:{STATE_FIPS_CO}"
-            in_ = None
-        key = census_key()
-        qs = f"get={','.join(vars_)}&for={for_}"
-        if in_:
-            qs += f"&in={in_}"
-        if key:
-            qs += f"&key={urllib.parse.quote(key, safe='')}"
-        return f"{base}?{qs}"
-
-    start_year = acs_start_year()
-    n_fallback = int(os.environ.get('ACS_FALLBACK_YEARS', '3'))
-    years_to_try = list(range(start_year, start_year - n_fallback, -1))
+    years_to_try = acs_years_to_try()
 
     raw = None
     for year in years_to_try:
         for series in ('acs1', 'acs5'):
-            url = build_url(year, series)
-            result = http_get_json(url)
-            if result and len(result) > 1:
-                raw = {result[0][i]: result[1][i] for i in range(len(result[0]))}
+            raw = _fetch_acs_row(year, series, _ACS_B08301_GET, geo_type, geoid, statewide)
+            if raw:
                 break
         if raw:
             break
@@ -1319,54 +1892,71 @@ def build_summary_cache():
     geos_preserved = 0
     core_regression_geos = 0
     total_fields_preserved = 0
-    for g in all_geos:
-        geoid = g['geoid']
-        geo_type = g['type']
-        out_path = os.path.join(OUT['summary_dir'], f"{geoid}.json")
+
+    def _fetch_sources(g: dict):
+        """Network half of one geography's summary (runs on a worker thread)."""
         try:
-            acs_profile = fetch_acs_profile(geo_type, geoid)
-            acs_s0801 = fetch_acs_s0801(geo_type, geoid)
-            acs_b08301 = fetch_acs_b08301(geo_type, geoid)
-            if acs_profile is None and acs_s0801 is None:
-                print(f"⚠ summary {geo_type}:{geoid}: no ACS data available – running diagnostics", file=sys.stderr)
-                _run_diagnostics(geo_type, geoid)
-                continue
-            if acs_profile is None:
-                print(f"⚠ summary {geo_type}:{geoid}: ACS profile missing; writing partial summary", file=sys.stderr)
-            if acs_s0801 is None:
-                print(f"⚠ summary {geo_type}:{geoid}: ACS S0801 missing; writing partial summary", file=sys.stderr)
-            # Derive actually-used series/year for source endpoint accuracy
-            # (commuting reliability: the endpoint should reflect the data truly used).
-            s0801_year = (acs_s0801 or {}).get('_acsYear', start_year)
-            s0801_series = (acs_s0801 or {}).get('_acsSeries', 'acs1')
-            payload = {
-                'updated': utc_now_z(),
-                'geo': g,
-                'acsProfile': normalize_acs_dict(acs_profile),
-                'acsS0801': normalize_acs_dict(acs_s0801),
-                'acsB08301': normalize_acs_dict(acs_b08301),
-                'source': {
-                    'acs_profile_endpoint': f'https://api.census.gov/data/{start_year}/acs/acs1/profile',
-                    'acs_s0801_endpoint': (
-                        f'https://api.census.gov/data/{s0801_year}/acs/{s0801_series}/subject'
-                    ),
-                    'acs_b08301_endpoint': f'https://api.census.gov/data/{start_year}/acs/acs1'
-                }
-            }
-            payload, n_preserved, core_reg = _merge_preserve_summary(out_path, payload)
-            if n_preserved:
-                geos_preserved += 1
-                total_fields_preserved += n_preserved
-                if core_reg:
-                    core_regression_geos += 1
-                    print(f"⚠ summary {geo_type}:{geoid}: fetch lost CORE fields — "
-                          f"preserved {n_preserved} value(s) from previous cache", file=sys.stderr)
-            with open(out_path, 'w', encoding='utf-8') as f:
-                json.dump(payload, f)
-            geos_written += 1
-            _log_file_written(out_path, f"summary:{geoid}")
+            return (
+                fetch_acs_profile(g['type'], g['geoid'], statewide=True),
+                fetch_acs_s0801(g['type'], g['geoid'], statewide=True),
+                fetch_acs_b08301(g['type'], g['geoid'], statewide=True),
+            )
         except Exception as e:
-            print(f"✗ summary {geo_type}:{geoid}: {e}", file=sys.stderr)
+            return e
+
+    # Each geography's fetches are independent; overlap them across a small
+    # worker pool.  pool.map yields results in all_geos order, so the merge
+    # and diagnostics below still run one geography at a time in the same
+    # order as before; the files are written together afterwards.
+    jobs = []
+    with ThreadPoolExecutor(max_workers=_HTTP_MAX_WORKERS) as pool:
+        for g, sources in zip(all_geos, pool.map(_fetch_sources, all_geos)):
+            geoid = g['geoid']
+            geo_type = g['type']
+            out_path = os.path.join(OUT['summary_dir'], f"{geoid}.json")
+            try:
+                if isinstance(sources, Exception):
+                    raise sources
+                acs_profile, acs_s0801, acs_b08301 = sources
+                if acs_profile is None and acs_s0801 is None:
+                    print(f"⚠ summary {geo_type}:{geoid}: no ACS data available – running diagnostics", file=sys.stderr)
+                    _run_diagnostics(geo_type, geoid)
+                    continue
+                if acs_profile is None:
+                    print(f"⚠ summary {geo_type}:{geoid}: ACS profile missing; writing partial summary", file=sys.stderr)
+                if acs_s0801 is None:
+                    print(f"⚠ summary {geo_type}:{geoid}: ACS S0801 missing; writing partial summary", file=sys.stderr)
+                # Derive actually-used series/year for source endpoint accuracy
+                # (commuting reliability: the endpoint should reflect the data truly used).
+                s0801_year = (acs_s0801 or {}).get('_acsYear', start_year)
+                s0801_series = (acs_s0801 or {}).get('_acsSeries', 'acs1')
+                payload = {
+                    'updated': utc_now_z(),
+                    'geo': g,
+                    'acsProfile': normalize_acs_dict(acs_profile),
+                    'acsS0801': normalize_acs_dict(acs_s0801),
+                    'acsB08301': normalize_acs_dict(acs_b08301),
+                    'source': {
+                        'acs_profile_endpoint': f'https://api.census.gov/data/{start_year}/acs/acs1/profile',
+                        'acs_s0801_endpoint': (
+                            f'https://api.census.gov/data/{s0801_year}/acs/{s0801_series}/subject'
+                        ),
+                        'acs_b08301_endpoint': f'https://api.census.gov/data/{start_year}/acs/acs1'
+                    }
+                }
+                payload, n_preserved, core_reg = _merge_preserve_summary(out_path, payload)
+                if n_preserved:
+                    geos_preserved += 1
+                    total_fields_preserved += n_preserved
+                    if core_reg:
+                        core_regression_geos += 1
+                        print(f"⚠ summary {geo_type}:{geoid}: fetch lost CORE fields — "
+                              f"preserved {n_preserved} value(s) from previous cache", file=sys.stderr)
+                jobs.append((out_path, payload, f"summary:{geoid}"))
+                geos_written += 1
+            except Exception as e:
+                print(f"✗ summary {geo_type}:{geoid}: {e}", file=sys.stderr)
+    _write_json_files(jobs)
 
     # Post-build integrity report. Backfill-owned variables are EXPECTED to
     # be preserved on every full rebuild (this script never fetches them);
@@ -1388,42 +1978,78 @@ def build_summary_cache():
         )
 
 
+def _aggregate_lodes_od(text_stream) -> tuple[dict, dict, dict]:
+    """Sum LODES OD S000 job counts into (within, inflow, outflow) by county.
+
+    The CO OD main file runs to millions of rows, so this reads it with a
+    plain csv.reader and indexes the three columns it needs by position
+    (looked up once from the header) instead of building a DictReader dict
+    for every row.
+    """
+    within = defaultdict(int)
+    inflow = defaultdict(int)
+    outflow = defaultdict(int)
+
+    reader = csv.reader(text_stream)
+    header = next(reader, None)
+    if not header:
+        return {}, {}, {}
+    try:
+        h_idx = header.index('h_geocode')
+        w_idx = header.index('w_geocode')
+        s_idx = header.index('S000')
+    except ValueError:
+        return {}, {}, {}
+
+    # Guard clauses rather than a per-row try/except: rows that are short,
+    # carry truncated geocodes or have a blank/zero job count are skipped;
+    # only a non-plain-integer S000 takes the slow int() path.
+    min_len = max(h_idx, w_idx, s_idx) + 1
+    for row in reader:
+        if len(row) < min_len:
+            continue
+        h = row[h_idx]
+        w = row[w_idx]
+        if len(h) < 5 or len(w) < 5:
+            continue
+        s = row[s_idx]
+        if s.isdecimal():
+            c = int(s)
+        else:
+            try:
+                c = int(s or '0')
+            except ValueError:
+                continue
+        if c <= 0:
+            continue
+        hc = h[:5]
+        wc = w[:5]
+        if hc == wc:
+            within[hc] += c
+        else:
+            outflow[hc] += c
+            inflow[wc] += c
+
+    return dict(within), dict(inflow), dict(outflow)
+
+
 def build_lehd_by_county():
     # LODES8 CO OD main file index: https://lehd.ces.census.gov/data/lodes/LODES8/co/od/
     year = os.environ.get('LODES_YEAR', '2023').strip() or '2023'
     url = f"https://lehd.ces.census.gov/data/lodes/LODES8/co/od/co_od_main_JT00_{year}.csv.gz"
 
     print(f"Downloading LEHD LODES OD (CO) {year}...")
-    raw = http_get(url, timeout=120)
-    bio = io.BytesIO(raw)
-
-    within = {}
-    inflow = {}
-    outflow = {}
-
-    with gzip.GzipFile(fileobj=bio, mode='rb') as gz:
-        reader = csv.DictReader(io.TextIOWrapper(gz, encoding='utf-8', newline=''))
-        for row in reader:
-            try:
-                h = row.get('h_geocode', '')
-                w = row.get('w_geocode', '')
-                c = int(row.get('S000', '0') or '0')
-                if len(h) < 5 or len(w) < 5 or c <= 0:
-                    continue
-                hc = h[:5]
-                wc = w[:5]
-                if hc == wc:
-                    within[hc] = within.get(hc, 0) + c
-                else:
-                    outflow[hc] = outflow.get(hc, 0) + c
-                    inflow[wc] = inflow.get(wc, 0) + c
-            except Exception:
-                continue
+    # Decompress and aggregate as the body arrives instead of holding the
+    # whole .gz in memory first.
+    with http_get_stream(url, timeout=120) as resp, _gzip.GzipFile(fileobj=resp, mode='rb') as gz:
+        within, inflow, outflow = _aggregate_lodes_od(
+            io.TextIOWrapper(gz, encoding='utf-8', newline=''))
 
     # Write one JSON per county
     counties = fetch_counties()
     county_ids = {c['geoid'] for c in counties}
 
+    jobs = []
     for c in sorted(county_ids):
         payload = {
             'updated': utc_now_z(),
@@ -1437,9 +2063,8 @@ def build_lehd_by_county():
                 'url': url
             }
         }
-        with open(os.path.join(OUT['lehd_dir'], f"{c}.json"), 'w', encoding='utf-8') as f:
-            json.dump(payload, f)
-        _log_file_written(os.path.join(OUT['lehd_dir'], f"{c}.json"), f"lehd:{c}")
+        jobs.append((os.path.join(OUT['lehd_dir'], f"{c}.json"), payload, f"lehd:{c}"))
+    _write_json_files(jobs)
 
     print(f"✓ LEHD county summaries written: {len(county_ids)}")
 
@@ -1529,17 +2154,18 @@ def _fetch_wac_gz(year: int, state: str = 'co') -> bytes | None:
     )
     print(f"  Downloading WAC {year}: {url}", file=sys.stderr)
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "HNA-ETL/1.0"})
-        with urllib.request.urlopen(req, timeout=120) as r:
-            if r.status == 404:
-                print(f"  WAC {year}: 404 (file not yet published)", file=sys.stderr)
-                return None
-            raw = r.read()
-        print(f"  WAC {year}: {len(raw):,} bytes downloaded", file=sys.stderr)
-        return raw
+        status, reason, _, raw = _http_request(url, timeout=120)
     except Exception as exc:
         print(f"  WAC {year}: download error — {exc}", file=sys.stderr)
         return None
+    if status == 404:
+        print(f"  WAC {year}: 404 (file not yet published)", file=sys.stderr)
+        return None
+    if not 200 <= status < 300:
+        print(f"  WAC {year}: download error — HTTP {status}: {reason}", file=sys.stderr)
+        return None
+    print(f"  WAC {year}: {len(raw):,} bytes downloaded", file=sys.stderr)
+    return raw
 
 
 def _parse_wac_by_county(raw_gz: bytes) -> dict[str, dict[str, int]]:
@@ -1547,7 +2173,7 @@ def _parse_wac_by_county(raw_gz: bytes) -> dict[str, dict[str, int]]:
     agg: dict[str, dict[str, int]] = {}
     cols_to_agg = (_WAC_TOTAL_COL,) + _WAC_WAGE_COLS + _WAC_INDUSTRY_COLS
 
-    with gzip.GzipFile(fileobj=io.BytesIO(raw_gz), mode='rb') as gz:
+    with _gzip.GzipFile(fileobj=io.BytesIO(raw_gz), mode='rb') as gz:
         reader = csv.DictReader(io.TextIOWrapper(gz, encoding='utf-8', newline=''))
         for row in reader:
             geocode = row.get('w_geocode', '')
@@ -1650,6 +2276,7 @@ def build_lehd_wac_snapshots() -> None:
 
     lehd_dir = OUT['lehd_dir']
     updated = 0
+    jobs = []
 
     for county_fips5 in sorted(
         {c for yr_data in year_county.values() for c in yr_data}
@@ -1732,51 +2359,26 @@ def build_lehd_wac_snapshots() -> None:
         if total > 0:
             payload['C000'] = total
 
-        with open(lehd_path, 'w', encoding='utf-8') as f:
-            json.dump(payload, f)
-        _log_file_written(lehd_path, f"lehd-wac:{county_fips5}")
+        jobs.append((lehd_path, payload, f"lehd-wac:{county_fips5}"))
         updated += 1
 
+    _write_json_files(jobs)
     print(f"✓ LEHD WAC snapshots merged into {updated} county files (years: {sorted_years})")
 
 
-def build_dola_sya_by_county():
-    # URL discovered via SDO Data Download page: https://demography.dola.colorado.gov/assets/html/sdodata.html
-    url = 'https://storage.googleapis.com/co-publicdata/sya-county.csv'
-    cache_path = os.path.join(OUT['cache_dir'], 'dola_sya_county.csv')
-    
-    print('Downloading DOLA/SDO single-year-of-age county file...')
-    status, text = http_get_text(url, timeout=120, retries=3)
-    
-    if status != 200:
-        # Download failed; try cache
-        if os.path.exists(cache_path):
-            print(f"ℹ Using cached DOLA file: {cache_path}", file=sys.stderr)
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    text = f.read()
-                status = 200
-            except Exception as e:
-                print(f"✗ Could not read cached DOLA file: {e}", file=sys.stderr)
-                print(f"⚠ Skipped SYA build: download failed and no cached file available", file=sys.stderr)
-                return
-        else:
-            print(f"⚠ Skipped SYA build: download failed and no cached file available", file=sys.stderr)
-            return
-
-    # Save to cache
-    try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            f.write(text)
-    except Exception as e:
-        print(f"⚠ Could not cache DOLA file: {e}", file=sys.stderr)
+def _parse_dola_sya(text: str) -> dict | None:
+    """Aggregate the DOLA SYA county CSV into the totals the SYA build writes.
 
+    Returns per-(county, year) totals and 65+ sums, the pyramid year and its
+    per-county male/female age maps, the sorted years present and the max
+    age; or None (after logging why) when the file cannot be used.
+    """
     # Parse CSV with banner row tolerance
-    fieldnames, reader = detect_header_and_reader(text)
+    fieldnames, reader = detect_header_and_rows(text)
 
     if reader is None or not fieldnames:
         print(f"⚠ Skipped SYA build: could not detect CSV header", file=sys.stderr)
-        return
+        return None
 
     # heuristics
     def pick(*cands):
@@ -1797,37 +2399,170 @@ def build_dola_sya_by_county():
 
     if not all([f_county, f_year, f_age]) or (not wide_format and not all([f_sex, f_pop])):
         print(f"⚠ Skipped SYA build: could not find required columns. Fields: {fieldnames}", file=sys.stderr)
-        return
-
-    # Gather available years and max age
-    rows = []
+        return None
+    # Columns are resolved to positions once; rows are plain lists.
+    i_cf, i_year, i_age = (fieldnames.index(f) for f in (f_county, f_year, f_age))
+    if wide_format:
+        i_a, i_b = fieldnames.index(f_male), fieldnames.index(f_female)
+    else:
+        i_a, i_b = fieldnames.index(f_sex), fieldnames.index(f_pop)
+
+    # Aggregate while reading instead of materialising every row first.
+    # County/year totals are small; only the pyramid year needs per-age
+    # detail.  That year is HNA_BASE_YEAR when the file has it, else the
+    # earliest year, so the earliest year seen so far is tracked as well.
+    totals_by_year: dict[tuple[str, int], int] = defaultdict(int)
+    age65_by_year: dict[tuple[str, int], int] = defaultdict(int)
+    base_pyramid: dict[str, dict] = {}
+    first_pyramid: dict[str, dict] = {}
+    first_year = None
     years = set()
     max_age = 0
+    n_rows = 0
     for r in reader:
         try:
-            cf = STATE_FIPS_CO + str(int(float(r[f_county]))).zfill(3)
-            yr = int(float(r[f_year]))
-            age = int(float(r[f_age]))
-            years.add(yr)
-            max_age = max(max_age, age)
+            cf = STATE_FIPS_CO + str(_csv_int(r[i_cf])).zfill(3)
+            yr = _csv_int(r[i_year])
+            age = _csv_int(r[i_age])
+        except Exception:
+            continue
+        # A row with a usable county/year/age still counts towards the
+        # years present and the max age even when its population cells
+        # are bad; in wide files a good male cell is kept when the female
+        # cell after it fails to parse.
+        years.add(yr)
+        max_age = max(max_age, age)
+        if first_year is None or yr < first_year:
+            first_year = yr
+            first_pyramid = {}
+        parts = []
+        try:
             if wide_format:
-                rows.append((cf, yr, age, 'm', int(float(r[f_male]))))
-                rows.append((cf, yr, age, 'f', int(float(r[f_female]))))
+                parts.append(('m', _csv_int(r[i_a])))
+                parts.append(('f', _csv_int(r[i_b])))
             else:
-                rows.append((cf, yr, age, str(r[f_sex]).strip().lower(), int(float(r[f_pop]))))
+                parts.append((r[i_a].strip().lower(), _csv_int(r[i_b])))
         except Exception:
-            continue
+            pass
+        for sex, pop in parts:
+            n_rows += 1
+            totals_by_year[cf, yr] += pop
+            if age >= 65:
+                age65_by_year[cf, yr] += pop
+            for pyr_year, pyr in ((HNA_BASE_YEAR, base_pyramid), (first_year, first_pyramid)):
+                if yr != pyr_year:
+                    continue
+                d = pyr.setdefault(cf, {'male': {}, 'female': {}})
+                if 'm' in sex:
+                    d['male'][age] = d['male'].get(age, 0) + pop
+                elif 'f' in sex:
+                    d['female'][age] = d['female'].get(age, 0) + pop
 
-    if not rows:
+    if not n_rows:
         print(f"⚠ Skipped SYA build: no valid data rows found", file=sys.stderr)
-        return
+        return None
 
-    years_sorted = sorted(years)
     # Pick the source vintage year (HNA_BASE_YEAR — currently 2024) for the
     # population pyramid snapshot; future years remain available via
     # seniorPressure.years for projections. Picking a future projection year
     # here would mislabel the pyramid as "as-of" a forecast year.
-    pyramid_year = HNA_BASE_YEAR if HNA_BASE_YEAR in years_sorted else years_sorted[0]
+    if HNA_BASE_YEAR in years:
+        pyramid_year, pyramids = HNA_BASE_YEAR, base_pyramid
+    else:
+        pyramid_year, pyramids = first_year, first_pyramid
+
+    return {
+        'totals_by_year': dict(totals_by_year),
+        'age65_by_year': dict(age65_by_year),
+        'pyramid_year': pyramid_year,
+        'pyramids': pyramids,
+        'years': sorted(years),
+        'max_age': max_age,
+    }
+
+
+# Bump when the shape returned by _parse_dola_sya changes.
+_DOLA_SYA_PARSED_VERSION = 2
+
+
+def _sya_to_json(sya: dict) -> dict:
+    """_parse_dola_sya() output in a JSON-safe shape (tuple and int keys flattened)."""
+    return {
+        'totals_by_year': [[cf, yr, v] for (cf, yr), v in sya['totals_by_year'].items()],
+        'age65_by_year': [[cf, yr, v] for (cf, yr), v in sya['age65_by_year'].items()],
+        'pyramid_year': sya['pyramid_year'],
+        'pyramids': {cf: {sex: list(ages.items()) for sex, ages in d.items()}
+                     for cf, d in sya['pyramids'].items()},
+        'years': sya['years'],
+        'max_age': sya['max_age'],
+    }
+
+
+def _sya_from_json(entry: dict) -> dict:
+    """Inverse of _sya_to_json()."""
+    return {
+        'totals_by_year': {(cf, yr): v for cf, yr, v in entry['totals_by_year']},
+        'age65_by_year': {(cf, yr): v for cf, yr, v in entry['age65_by_year']},
+        'pyramid_year': entry['pyramid_year'],
+        'pyramids': {cf: {sex: {age: pop for age, pop in ages} for sex, ages in d.items()}
+                     for cf, d in entry['pyramids'].items()},
+        'years': entry['years'],
+        'max_age': entry['max_age'],
+    }
+
+
+def _load_dola_sya(text: str) -> dict | None:
+    """_parse_dola_sya(text), reusing an earlier run's result when the CSV is unchanged.
+
+    Parsing the ~20 MB SYA file is the slow part of the SYA build and the
+    file changes once a vintage.  With HNA_BUILD_CACHE_DIR set, the
+    aggregates are kept there as JSON, stamped with the CSV's SHA-1 and
+    HNA_BASE_YEAR (which picks the pyramid year), and reused only when both
+    still match.  Without it every run parses the CSV.
+    """
+    cache_dir = _build_cache_dir()
+    if cache_dir is None:
+        return _parse_dola_sya(text)
+    parsed_path = os.path.join(cache_dir, 'dola_sya_county.parsed.json')
+    stamp = [_DOLA_SYA_PARSED_VERSION, HNA_BASE_YEAR, hashlib.sha1(text.encode('utf-8')).hexdigest()]
+    try:
+        with open(parsed_path, 'rb') as f:
+            entry = _json_loads(f.read())
+        if entry['stamp'] == stamp:
+            print(f"ℹ Reusing parsed DOLA SYA aggregates: {parsed_path}", file=sys.stderr)
+            return _sya_from_json(entry['data'])
+    except Exception:
+        pass
+    data = _parse_dola_sya(text)
+    if data is not None:
+        try:
+            _ensure_dir(cache_dir)
+            _write_json_file(parsed_path, {'stamp': stamp, 'data': _sya_to_json(data)})
+        except OSError as e:
+            print(f"⚠ Could not cache parsed DOLA SYA aggregates: {e}", file=sys.stderr)
+    return data
+
+
+def build_dola_sya_by_county():
+    # URL discovered via SDO Data Download page: https://demography.dola.colorado.gov/assets/html/sdodata.html
+    url = 'https://storage.googleapis.com/co-publicdata/sya-county.csv'
+    cache_path = os.path.join(OUT['cache_dir'], 'dola_sya_county.csv.gz')
+
+    print('Downloading DOLA/SDO single-year-of-age county file...')
+    text = fetch_csv_with_cache(url, cache_path, 'DOLA single-year-of-age county file', timeout=120)
+    if text is None:
+        print(f"⚠ Skipped SYA build: download failed and no cached file available", file=sys.stderr)
+        return
+
+    sya = _load_dola_sya(text)
+    if sya is None:
+        return
+    totals_by_year = sya['totals_by_year']
+    age65_by_year = sya['age65_by_year']
+    pyramid_year = sya['pyramid_year']
+    pyramids = sya['pyramids']
+    years_sorted = sya['years']
+    max_age = sya['max_age']
 
     # senior pressure years
     target_years = [2020, 2024, 2030, 2035, 2040, 2045, 2050]
@@ -1835,35 +2570,20 @@ def build_dola_sya_by_county():
     if not avail_years:
         avail_years = [years_sorted[-1]]
 
-    # bucket rows by county
-    by_county: dict[str, dict] = {}
-    for cf, yr, age, sex, pop in rows:
-        d = by_county.setdefault(cf, {
-            'pyramid': {'male': {}, 'female': {}},
-            'totals_by_year': {},
-            'age65_by_year': {}
-        })
-
-        if yr == pyramid_year:
-            if 'm' in sex:
-                d['pyramid']['male'][age] = d['pyramid']['male'].get(age, 0) + pop
-            elif 'f' in sex:
-                d['pyramid']['female'][age] = d['pyramid']['female'].get(age, 0) + pop
-
-        if yr in avail_years:
-            d['totals_by_year'][yr] = d['totals_by_year'].get(yr, 0) + pop
-            if age >= 65:
-                d['age65_by_year'][yr] = d['age65_by_year'].get(yr, 0) + pop
+    counties = dict.fromkeys(cf for cf, _ in totals_by_year)
+    empty_pyramid = {'male': {}, 'female': {}}
 
     # write json
     ages = list(range(0, max_age + 1))
-    for cf, d in by_county.items():
-        male = [d['pyramid']['male'].get(a, 0) for a in ages]
-        female = [d['pyramid']['female'].get(a, 0) for a in ages]
-
-        years_out = sorted(avail_years)
-        pop65 = [d['age65_by_year'].get(y, 0) for y in years_out]
-        tot = [d['totals_by_year'].get(y, 0) for y in years_out]
+    years_out = sorted(avail_years)
+    jobs = []
+    for cf in counties:
+        pyr = pyramids.get(cf, empty_pyramid)
+        male = [pyr['male'].get(a, 0) for a in ages]
+        female = [pyr['female'].get(a, 0) for a in ages]
+
+        pop65 = [age65_by_year.get((cf, y), 0) for y in years_out]
+        tot = [totals_by_year.get((cf, y), 0) for y in years_out]
         share65 = [round((pop65[i] / tot[i] * 100), 3) if tot[i] else 0 for i in range(len(years_out))]
 
         payload = {
@@ -1884,11 +2604,10 @@ def build_dola_sya_by_county():
                 'notes': 'Pyramid uses the selected pyramidYear; senior pressure uses available years in the file.'
             }
         }
-        with open(os.path.join(OUT['dola_dir'], f"{cf}.json"), 'w', encoding='utf-8') as f:
-            json.dump(payload, f)
-        _log_file_written(os.path.join(OUT['dola_dir'], f"{cf}.json"), f"dola_sya:{cf}")
+        jobs.append((os.path.join(OUT['dola_dir'], f"{cf}.json"), payload, f"dola_sya:{cf}"))
+    _write_json_files(jobs)
 
-    print(f"✓ DOLA SYA county files written: {len(by_county)}")
+    print(f"✓ DOLA SYA county files written: {len(counties)}")
 
 
 def build_dola_projections_by_county():
@@ -1901,16 +2620,16 @@ def build_dola_projections_by_county():
     """
     url_components = 'https://storage.googleapis.com/co-publicdata/components-change-county.csv'
     url_profiles = 'https://storage.googleapis.com/co-publicdata/profiles-county.csv'
-    comp_cache = os.path.join(OUT['cache_dir'], 'dola_components_county.csv')
-    prof_cache = os.path.join(OUT['cache_dir'], 'dola_profiles_county.csv')
+    comp_cache = os.path.join(OUT['cache_dir'], 'dola_components_county.csv.gz')
+    prof_cache = os.path.join(OUT['cache_dir'], 'dola_profiles_county.csv.gz')
 
     print('Downloading DOLA/SDO county components-of-change...')
     comp_text = fetch_csv_with_cache(url_components, comp_cache, 'county components-of-change')
     if comp_text is None:
         return
 
-    comp_fields, comp_reader = detect_header_and_reader(comp_text)
-    if comp_reader is None:
+    comp_fields, comp_rows = detect_header_and_rows(comp_text)
+    if comp_rows is None:
         print(f"⚠ Skipped projections build: could not detect header in components-change-county", file=sys.stderr)
         return
 
@@ -1924,58 +2643,77 @@ def build_dola_projections_by_county():
         print(f"⚠ Skipped projections build: could not find required columns in components-change-county. Headers: {comp_fields}", file=sys.stderr)
         return
 
-    # Read into dict[county][year] = {pop, netmig}
-    comp = {}
+    # One flat store per field keyed by (county, year), plus each county's
+    # years, instead of a small {pop, netmig} dict per row.
+    comp_pop: dict[tuple[str, int], float] = {}
+    comp_netmig: dict[tuple[str, int], float] = {}
+    comp_years: dict[str, set] = defaultdict(set)
     max_estimate_year = 0
-    for r in comp_reader:
+    i_cf, i_year, i_pop, i_netmig = (comp_fields.index(f) for f in (f_cf, f_year, f_pop, f_netmig))
+    i_dtype = comp_fields.index(f_dtype) if f_dtype else None
+    min_len = max(i_cf, i_year, i_pop, i_netmig) + 1
+    for row in comp_rows:
+        if len(row) < min_len:
+            continue
         try:
-            raw_cf = int(float(r[f_cf]))
+            raw_cf = _csv_int(row[i_cf])
             if raw_cf <= 0:
                 continue  # skip state-level totals (countyfips=0)
-            cf = STATE_FIPS_CO + str(raw_cf).zfill(3)
-            yr = int(float(r[f_year]))
-            pop = float(r[f_pop])
-            netmig = float(r[f_netmig])
-            d = comp.setdefault(cf, {})
-            d[yr] = {'pop': pop, 'netmig': netmig}
-            # Track last estimate year (vs projection) for base year selection
-            if f_dtype and str(r.get(f_dtype, '')).strip().lower().startswith('estimate'):
-                max_estimate_year = max(max_estimate_year, yr)
-        except Exception:
+            yr = _csv_int(row[i_year])
+            pop = float(row[i_pop])
+            netmig = float(row[i_netmig])
+        except (ValueError, OverflowError):
             continue
+        cf = STATE_FIPS_CO + str(raw_cf).zfill(3)
+        comp_pop[cf, yr] = pop
+        comp_netmig[cf, yr] = netmig
+        comp_years[cf].add(yr)
+        # Track last estimate year (vs projection) for base year selection
+        if i_dtype is not None and i_dtype < len(row) and row[i_dtype].strip().lower().startswith('estimate'):
+            max_estimate_year = max(max_estimate_year, yr)
 
     print('Downloading DOLA/SDO county population profiles...')
     prof_text = fetch_csv_with_cache(url_profiles, prof_cache, 'county population profiles')
 
-    profiles: dict = {}
+    prof_households: dict[tuple[str, int], float] = {}
+    prof_units: dict[tuple[str, int], float] = {}
+    prof_vac: dict[tuple[str, int], float | None] = {}
     max_profile_year = 0
     if prof_text is None:
         print("⚠ County housing/profile data unavailable; projections will proceed without housing metrics", file=sys.stderr)
     else:
-        prof_fields, prof_reader = detect_header_and_reader(prof_text)
+        prof_fields, prof_rows = detect_header_and_rows(prof_text)
         p_cf = pick_substr(prof_fields, 'countyfips', 'county_fips', 'fips', 'county')
         p_year = pick_substr(prof_fields, 'year')
         p_hh = pick_substr(prof_fields, 'households', 'hh')
         p_units = pick_substr(prof_fields, 'totalhousingunits', 'total_housing_units', 'housing_units', 'units')
         p_vac = pick_substr(prof_fields, 'vacancy_rate', 'vacancyrate', 'vac_rate', 'vacancy')
 
-        if prof_reader is None or not all([p_cf, p_year, p_hh, p_units]):
+        if prof_rows is None or not all([p_cf, p_year, p_hh, p_units]):
             print(f"⚠ Unexpected profiles-county schema; housing metrics will be omitted. Fields: {prof_fields}", file=sys.stderr)
         else:
-            for r in prof_reader:
+            i_cf, i_year, i_hh, i_units = (prof_fields.index(f) for f in (p_cf, p_year, p_hh, p_units))
+            i_vac = prof_fields.index(p_vac) if p_vac else None
+            min_len = max(i_cf, i_year, i_hh, i_units) + 1
+            for row in prof_rows:
+                if len(row) < min_len:
+                    continue
                 try:
-                    raw_cf = int(float(r[p_cf]))
+                    raw_cf = _csv_int(row[i_cf])
                     if raw_cf <= 0:
                         continue
-                    cf = STATE_FIPS_CO + str(raw_cf).zfill(3)
-                    yr = int(float(r[p_year]))
-                    hh = float(r[p_hh])
-                    units = float(r[p_units])
-                    vac = float(r[p_vac]) if p_vac and r.get(p_vac) not in (None, '', 'NA') else None
-                    profiles.setdefault(cf, {})[yr] = {'households': hh, 'units': units, 'vacancy_rate': vac}
-                    max_profile_year = max(max_profile_year, yr)
-                except Exception:
+                    yr = _csv_int(row[i_year])
+                    hh = float(row[i_hh])
+                    units = float(row[i_units])
+                    vac_cell = row[i_vac] if i_vac is not None and i_vac < len(row) else None
+                    vac = float(vac_cell) if vac_cell not in (None, '', 'NA') else None
+                except (ValueError, OverflowError):
                     continue
+                cf = STATE_FIPS_CO + str(raw_cf).zfill(3)
+                prof_households[cf, yr] = hh
+                prof_units[cf, yr] = units
+                prof_vac[cf, yr] = vac
+                max_profile_year = max(max_profile_year, yr)
 
     counties = fetch_counties()
     if not counties:
@@ -1986,54 +2724,52 @@ def build_dola_projections_by_county():
             counties = _gc.get('counties', [])
         except Exception:
             counties = []
-    county_ids = {c['geoid'] for c in counties} if counties else set(comp.keys())
+    county_ids = {c['geoid'] for c in counties} if counties else set(comp_years)
+
+    # Counties normally all share HNA_BASE_YEAR, so each horizon year list
+    # is built once per distinct base year rather than once per county.
+    horizon = 20
+    out_years_by_base: dict[int, list[int]] = {}
 
+    jobs = []
     for cf in sorted(county_ids):
-        years = sorted(comp.get(cf, {}).keys())
+        years = sorted(comp_years.get(cf, ()))
         if not years:
             continue
 
         # Rule 3: keep projection base year pinned to the current data vintage.
         base_year = HNA_BASE_YEAR
-        if base_year not in comp.get(cf, {}):
+        if (cf, base_year) not in comp_pop:
             # fall back to last comp year <= base_year when source data is incomplete
             base_candidates = [y for y in years if y <= base_year]
             base_year = base_candidates[-1] if base_candidates else years[-1]
 
-        horizon = 20
-        out_years = list(range(base_year, base_year + horizon + 1))
+        out_years = out_years_by_base.get(base_year)
+        if out_years is None:
+            out_years = out_years_by_base[base_year] = list(range(base_year, base_year + horizon + 1))
 
-        pop_dola = []
-        netmig = []
-        for y in out_years:
-            rec = comp.get(cf, {}).get(y)
-            pop_dola.append(rec['pop'] if rec else None)
-            if y == base_year:
-                netmig.append(0)
-            else:
-                netmig.append(comp.get(cf, {}).get(y, {}).get('netmig', None))
+        # out_years[0] is base_year, which always has a components row.
+        pop_dola = [comp_pop.get((cf, y)) for y in out_years]
+        netmig = [0] + [comp_netmig.get((cf, y)) for y in out_years[1:]]
 
         # Historic CAGR (10 years) as sensitivity
         hist_span = 10
         y0 = base_year - hist_span
-        pop0 = comp.get(cf, {}).get(y0, {}).get('pop')
-        popb = comp.get(cf, {}).get(base_year, {}).get('pop')
+        pop0 = comp_pop.get((cf, y0))
+        popb = pop_dola[0]
         cagr = None
         if pop0 and popb and pop0 > 0:
             cagr = (popb / pop0) ** (1.0 / hist_span) - 1.0
 
-        pop_trend = []
         if popb and cagr is not None:
-            for i, y in enumerate(out_years):
-                pop_trend.append(popb * ((1.0 + cagr) ** i))
+            pop_trend = [popb * ((1.0 + cagr) ** i) for i in range(horizon + 1)]
         else:
-            pop_trend = [None for _ in out_years]
+            pop_trend = [None] * len(out_years)
 
         # Housing need conversion
-        prof = profiles.get(cf, {}).get(base_year)
-        base_units = prof['units'] if prof else None
-        base_households = prof['households'] if prof else None
-        base_vac = prof.get('vacancy_rate') if prof else None
+        base_units = prof_units.get((cf, base_year))
+        base_households = prof_households.get((cf, base_year))
+        base_vac = prof_vac.get((cf, base_year))
 
         headship = (base_households / popb) if (base_households and popb) else None
 
@@ -2094,29 +2830,18 @@ def build_dola_projections_by_county():
         else:
             target_vac = HUD_HEALTHY_TARGET
 
-        hh_dola = []
-        units_needed = []
-        inc_units = []
-        base_units_needed = None
-
-        for i, p in enumerate(pop_dola):
-            if p is None or headship is None:
-                hh_dola.append(None)
-                units_needed.append(None)
-                inc_units.append(None)
-                continue
-            hh = p * headship
-            hh_dola.append(hh)
-            need = hh / (1.0 - target_vac)
-            units_needed.append(need)
-            if out_years[i] == base_year and base_units_needed is None:
-                base_units_needed = need
-            if base_units_needed is None:
-                inc_units.append(None)
-            elif out_years[i] == base_year:
-                inc_units.append(0.0)
-            else:
-                inc_units.append(need - base_units_needed)
+        # headship is only set when popb (pop_dola[0]) is, so whenever the
+        # series exist their base-year entry does too.
+        if headship is None:
+            hh_dola = [None] * len(out_years)
+            units_needed = [None] * len(out_years)
+            inc_units = [None] * len(out_years)
+        else:
+            hh_dola = [p * headship if p is not None else None for p in pop_dola]
+            units_needed = [hh / (1.0 - target_vac) if hh is not None else None for hh in hh_dola]
+            base_units_needed = units_needed[0]
+            inc_units = [0.0] + [need - base_units_needed if need is not None else None
+                                 for need in units_needed[1:]]
 
         # ── Additive need components (2026-07): replacement + tenure split ──
         # Professional SB24-174-era HNAs (Root Policy La Plata 2025, Ayres
@@ -2176,31 +2901,20 @@ def build_dola_projections_by_county():
             for y in out_years
         ]
 
-        units_needed_tenure = []
-        inc_units_tenure = []
-        base_need_tenure = None
-        for i, hh in enumerate(hh_dola):
-            if hh is None or owner_share_dec is None or renter_share_dec is None:
-                units_needed_tenure.append(None)
-                inc_units_tenure.append(None)
-                continue
-            need_t = (hh * owner_share_dec / (1.0 - TARGET_VACANCY_OWNER)
-                      + hh * renter_share_dec / (1.0 - TARGET_VACANCY_RENTAL))
-            units_needed_tenure.append(need_t)
-            if out_years[i] == base_year and base_need_tenure is None:
-                base_need_tenure = need_t
-            if base_need_tenure is None:
-                inc_units_tenure.append(None)
-            elif out_years[i] == base_year:
-                inc_units_tenure.append(0.0)
-            else:
-                inc_units_tenure.append(need_t - base_need_tenure)
+        if headship is None or owner_share_dec is None or renter_share_dec is None:
+            units_needed_tenure = [None] * len(out_years)
+            inc_units_tenure = [None] * len(out_years)
+        else:
+            units_needed_tenure = [
+                (hh * owner_share_dec / (1.0 - TARGET_VACANCY_OWNER)
+                 + hh * renter_share_dec / (1.0 - TARGET_VACANCY_RENTAL)) if hh is not None else None
+                for hh in hh_dola
+            ]
+            base_need_tenure = units_needed_tenure[0]
+            inc_units_tenure = [0.0] + [need_t - base_need_tenure if need_t is not None else None
+                                        for need_t in units_needed_tenure[1:]]
 
-        netmig_20y = None
-        try:
-            netmig_20y = sum([n for n in netmig[1:] if n is not None])
-        except Exception:
-            netmig_20y = None
+        netmig_20y = sum(n for n in netmig[1:] if n is not None)
 
         payload = {
             'updated': utc_now_z(),
@@ -2266,10 +2980,9 @@ def build_dola_projections_by_county():
             }
         }
 
-        with open(os.path.join(OUT['proj_dir'], f"{cf}.json"), 'w', encoding='utf-8') as f:
-            json.dump(payload, f)
-        _log_file_written(os.path.join(OUT['proj_dir'], f"{cf}.json"), f"projections:{cf}")
+        jobs.append((os.path.join(OUT['proj_dir'], f"{cf}.json"), payload, f"projections:{cf}"))
 
+    _write_json_files(jobs)
     print(f"✓ DOLA projections written: {len(county_ids)}")
 
     # Build statewide aggregate (08.json) immediately after all county files exist.
@@ -2439,8 +3152,7 @@ def _build_state_projection_aggregate():
     }
 
     out_path = os.path.join(OUT['proj_dir'], f"{STATE_FIPS_CO}.json")
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(payload, f)
+    _write_json_file(out_path, payload)
     _log_file_written(out_path, f"projections:{STATE_FIPS_CO}")
     print(f"✓ DOLA statewide projection written: {out_path}")
 
@@ -2473,15 +3185,32 @@ def build_geo_derived_inputs():
         'geos': {}
     }
 
-    county_cache: dict[str, tuple[dict, str, dict, str]] = {}
+    # Every (year, geography) profile is independent: fetch each featured
+    # geo and each containing county once, across a small worker pool, then
+    # derive in FEATURED order as before.  A failed fetch is kept as its
+    # exception and re-raised where the value is used.
+    tasks: list[tuple[int, str, str]] = []
+    for g in FEATURED:
+        containing = g.get('containingCounty') if g['type'] != 'county' else g['geoid']
+        if containing:
+            for y in (y0, y1):
+                tasks += [(y, g['type'], g['geoid']), (y, 'county', containing)]
+    tasks = list(dict.fromkeys(tasks))
+
+    def _fetch(task: tuple[int, str, str]):
+        try:
+            return fetch_acs5_profile_year(*task, vars_)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=_HTTP_MAX_WORKERS) as pool:
+        fetched = dict(zip(tasks, pool.map(_fetch, tasks)))
 
-    def get_county(county_geoid: str):
-        if county_geoid in county_cache:
-            return county_cache[county_geoid]
-        r0, u0 = fetch_acs5_profile_year(y0, 'county', county_geoid, vars_)
-        r1, u1 = fetch_acs5_profile_year(y1, 'county', county_geoid, vars_)
-        county_cache[county_geoid] = (r0, u0, r1, u1)
-        return county_cache[county_geoid]
+    def get_profile(year: int, geo_type: str, geoid: str) -> tuple[dict, str]:
+        res = fetched[year, geo_type, geoid]
+        if isinstance(res, Exception):
+            raise res
+        return res
 
     for g in FEATURED:
         geo_type = g['type']
@@ -2491,8 +3220,8 @@ def build_geo_derived_inputs():
             continue
 
         try:
-            r0, u0 = fetch_acs5_profile_year(y0, geo_type, geoid, vars_)
-            r1, u1 = fetch_acs5_profile_year(y1, geo_type, geoid, vars_)
+            r0, u0 = get_profile(y0, geo_type, geoid)
+            r1, u1 = get_profile(y1, geo_type, geoid)
 
             pop0 = safe_float(r0.get('DP05_0001E'))
             pop1 = safe_float(r1.get('DP05_0001E'))
@@ -2505,7 +3234,8 @@ def build_geo_derived_inputs():
             head_slope = ((head1 - head0) / (y1 - y0)) if (head0 is not None and head1 is not None) else None
             pop_cagr = annual_growth_rate(pop0, pop1, (y1 - y0))
 
-            c0, cu0, c1, cu1 = get_county(containing)
+            c0, cu0 = get_profile(y0, 'county', containing)
+            c1, cu1 = get_profile(y1, 'county', containing)
             cpop0 = safe_float(c0.get('DP05_0001E'))
             cpop1 = safe_float(c1.get('DP05_0001E'))
             county_cagr = annual_growth_rate(cpop0, cpop1, (y1 - y0))
@@ -2547,8 +3277,7 @@ def build_geo_derived_inputs():
             print(f"✗ derived inputs {geo_type}:{geoid}: {e}", file=sys.stderr)
 
     out_path = os.path.join(OUT['derived_dir'], 'geo-derived.json')
-    with open(out_path, 'w', encoding='utf-8') as f:
-        json.dump(derived, f)
+    _write_json_file(out_path, derived)
     _log_file_written(out_path, 'derived:geo-derived')
 
 
@@ -2601,8 +3330,7 @@ def write_geo_config():
             'place_list': f"Census ACS 5-year {acs_start_year()} place names (Colorado; regenerated by build_hna_data.py via GitHub Actions)",
         }
     }
-    with open(OUT['geo_config'], 'w', encoding='utf-8') as f:
-        json.dump(payload, f)
+    _write_json_file(OUT['geo_config'], payload)
     _log_file_written(OUT['geo_config'], 'geo-config')
     print(f"✓ geo-config counties: {len(counties)}, places: {len(places)}, cdps: {len(cdps)}")
 
@@ -2636,6 +3364,41 @@ def _sum_dir_bytes(path: str) -> int:
         return 0
 
 
+# Output files are small; a handful of writer threads is enough to overlap
+# the open/write/rename latency.
+_WRITE_MAX_WORKERS = 8
+
+
+def _write_json_file(path: str, payload) -> None:
+    """Write *payload* as JSON via a temp file + os.replace.
+
+    The bytes are those json.dump(payload, f) would write (see
+    _json_dumps_bytes); readers (and an interrupted build) never see a
+    half-written file.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps_bytes(payload))
+    os.replace(tmp_path, path)
+
+
+def _write_json_files(jobs: list[tuple[str, object, str]]) -> None:
+    """Write many (path, payload, label) outputs on a small thread pool.
+
+    The per-county builders emit dozens of small files; serialising and
+    writing them concurrently overlaps the filesystem latency.  The
+    "wrote N bytes" log lines are still printed in *jobs* order.
+    """
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_WRITE_MAX_WORKERS, len(jobs))) as pool:
+            list(pool.map(lambda job: _write_json_file(job[0], job[1]), jobs))
+    else:
+        for path, payload, _ in jobs:
+            _write_json_file(path, payload)
+    for path, _, label in jobs:
+        _log_file_written(path, label)
+
+
 def _log_file_written(path: str, label: str) -> None:
     """Print file size after writing; warn to stderr on zero-byte output."""
     try:
@@ -2703,30 +3466,49 @@ def main():
     _log_step('geo-config')
     write_geo_config()
 
-    if os.environ.get('SKIP_ACS', '').lower() != 'true':
+    def _acs_stages():
         _log_step('ACS summary cache')
         build_summary_cache()
         if os.environ.get('SKIP_DERIVED', '').lower() != 'true':
             _log_step('geo-derived inputs')
             build_geo_derived_inputs()
-    else:
-        print('  ℹ Skipping ACS (SKIP_ACS=true)')
 
-    if os.environ.get('SKIP_LEHD', '').lower() != 'true':
+    def _lehd_stages():
         _log_step('LEHD by county')
         build_lehd_by_county()
         _log_step('LEHD WAC annual snapshots (2019–2023)')
         build_lehd_wac_snapshots()
-    else:
-        print('  ℹ Skipping LEHD (SKIP_LEHD=true)')
 
-    if os.environ.get('SKIP_DOLA', '').lower() != 'true':
+    def _dola_sya_stage():
         _log_step('DOLA SYA by county')
         build_dola_sya_by_county()
+
+    skip_acs = os.environ.get('SKIP_ACS', '').lower() == 'true'
+    skip_lehd = os.environ.get('SKIP_LEHD', '').lower() == 'true'
+    skip_dola = os.environ.get('SKIP_DOLA', '').lower() == 'true'
+    if skip_acs:
+        print('  ℹ Skipping ACS (SKIP_ACS=true)')
+    if skip_lehd:
+        print('  ℹ Skipping LEHD (SKIP_LEHD=true)')
+    if skip_dola:
+        print('  ℹ Skipping DOLA (SKIP_DOLA=true)')
+
+    # The ACS, LEHD and DOLA SYA stages hit different hosts and write
+    # different directories, so they run side by side (their log lines
+    # interleave), sharing the _HTTP_SLOTS request limit.  DOLA projections read the ACS summary cache for
+    # active-market vacancy, so they wait for every lane to finish.  The
+    # first lane to fail (including build_summary_cache's SystemExit)
+    # re-raises here once all lanes have stopped.
+    lanes = [fn for fn, skip in ((_acs_stages, skip_acs), (_lehd_stages, skip_lehd),
+                                 (_dola_sya_stage, skip_dola)) if not skip]
+    with ThreadPoolExecutor(max_workers=max(1, len(lanes))) as pool:
+        futures = [pool.submit(fn) for fn in lanes]
+    for fut in futures:
+        fut.result()
+
+    if not skip_dola:
         _log_step('DOLA projections by county')
         build_dola_projections_by_county()
-    else:
-        print('  ℹ Skipping DOLA (SKIP_DOLA=true)')
 
     _log_step('home-value cascade summary stamp')
     stamp_home_value_cascade()
@@ -0,0 +1,254 @@
+"""tests/test_build_hna_data_csv.py
+Unit tests for the banner-tolerant CSV helpers in ``scripts/hna/build_hna_data.py``.
+
+DOLA/SDO CSVs sometimes open with one or more banner rows ("Vintage 2023
+estimates ...") before the real header.  Both helpers must skip those rows
+and hand back a reader positioned on the header.
+
+Tested functions
+----------------
+* ``build_hna_data.detect_header_and_reader``  — in-memory text variant
+* ``build_hna_data.detect_header_and_rows``    — same, positional rows
+* ``build_hna_data.read_csv_with_banner_skip`` — on-disk file variant
+* ``build_hna_data.pick_substr``               — schema-drift column lookup
+* ``build_hna_data._csv_int``                   — integer cell parsing
+* ``build_hna_data._parse_dola_sya``            — SYA county/year aggregation
+* ``build_hna_data._load_dola_sya``             — parsed SYA aggregate cache
+* ``build_hna_data._write_text_cache`` / ``_read_text_cache`` — gzip CSV caches
+* ``build_hna_data._write_json_files``         — data/hna JSON output writer
+
+Run with::
+
+    pytest tests/test_build_hna_data_csv.py -v
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup — allow direct imports from scripts/hna without installation
+# ---------------------------------------------------------------------------
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_HNA_DIR   = os.path.join(_REPO_ROOT, 'scripts', 'hna')
+if _HNA_DIR not in sys.path:
+    sys.path.insert(0, _HNA_DIR)
+
+import build_hna_data  # noqa: E402
+from build_hna_data import (  # noqa: E402
+    _csv_int,
+    _load_dola_sya,
+    _parse_dola_sya,
+    _read_text_cache,
+    _write_json_files,
+    _write_text_cache,
+    detect_header_and_reader,
+    detect_header_and_rows,
+    pick_substr,
+    read_csv_with_banner_skip,
+)
+
+BANNER_CSV = (
+    'Vintage 2023 Single Year of Age estimates,,\n'
+    'Source: State Demography Office\n'
+    'countyfips,year,age,totalpopulation\n'
+    '77,2023,0,1500\n'
+    '77,2023,1,1525\n'
+)
+
+
+class TestDetectHeaderAndReader:
+
+    def test_skips_banner_rows(self):
+        fields, reader = detect_header_and_reader(BANNER_CSV)
+        assert fields == ['countyfips', 'year', 'age', 'totalpopulation']
+        rows = list(reader)
+        assert len(rows) == 2
+        assert rows[0]['totalpopulation'] == '1500'
+
+    def test_keyword_may_be_part_of_a_field_name(self):
+        text = 'Area Name,Total Households,Housing Units\nMesa,64000,70000\n'
+        fields, reader = detect_header_and_reader(text)
+        assert fields == ['Area Name', 'Total Households', 'Housing Units']
+        assert list(reader)[0]['Housing Units'] == '70000'
+
+    def test_requires_three_non_empty_fields(self):
+        text = 'county,,\nfips,year\n'
+        assert detect_header_and_reader(text) == ([], None)
+
+    def test_empty_text(self):
+        assert detect_header_and_reader('') == ([], None)
+
+
+class TestDetectHeaderAndRows:
+
+    def test_skips_banner_rows(self):
+        fields, rows = detect_header_and_rows(BANNER_CSV)
+        assert fields == ['countyfips', 'year', 'age', 'totalpopulation']
+        assert list(rows) == [['77', '2023', '0', '1500'], ['77', '2023', '1', '1525']]
+
+    def test_crlf_banner_and_quoted_newline(self):
+        text = 'Banner\r\nfips,year,name\r\n77,2023,"Mesa\nCounty"\r\n'
+        fields, rows = detect_header_and_rows(text)
+        assert fields == ['fips', 'year', 'name']
+        assert list(rows) == [['77', '2023', 'Mesa\nCounty']]
+
+    def test_no_header(self):
+        assert detect_header_and_rows('county,,\nfips,year\n') == ([], None)
+        assert detect_header_and_rows('') == ([], None)
+
+
+class TestReadCsvWithBannerSkip:
+
+    def test_skips_banner_rows(self, tmp_path):
+        path = tmp_path / 'sya.csv'
+        path.write_text(BANNER_CSV, encoding='utf-8')
+        header, rows = read_csv_with_banner_skip(str(path))
+        assert header == ['countyfips', 'year', 'age', 'totalpopulation']
+        assert [r['age'] for r in rows] == ['0', '1']
+
+    def test_keyword_must_be_a_whole_field(self, tmp_path):
+        # "Vintage year" contains "year" but is not a header column; the
+        # following row with an exact "fips" field is.
+        path = tmp_path / 'p.csv'
+        path.write_text('Vintage year 2023,x,y\nfips, Name ,pop\n08077,Mesa,158000\n', encoding='utf-8')
+        header, rows = read_csv_with_banner_skip(str(path))
+        assert header == ['fips', 'Name', 'pop']
+        assert rows[0]['pop'] == '158000'
+
+    def test_missing_file(self, tmp_path):
+        assert read_csv_with_banner_skip(str(tmp_path / 'absent.csv')) == ([], [])
+
+
+class TestPickSubstr:
+
+    FIELDS = ['countyfips', 'Year', 'TotalPopulation', 'netMigration']
+
+    def test_exact_match_wins_over_earlier_substring(self):
+        assert pick_substr(['county_name', 'fips'], 'fips', 'county') == 'fips'
+
+    def test_case_insensitive_substring(self):
+        assert pick_substr(self.FIELDS, 'year') == 'Year'
+        assert pick_substr(self.FIELDS, 'totalpop', 'pop') == 'TotalPopulation'
+
+    def test_candidate_order_is_respected(self):
+        assert pick_substr(self.FIELDS, 'netmig', 'county') == 'netMigration'
+
+    def test_no_match(self):
+        assert pick_substr(self.FIELDS, 'vacancy') is None
+
+    def test_repeated_lookups_on_one_header(self):
+        fields = list(self.FIELDS)
+        assert [pick_substr(fields, c) for c in ('countyfips', 'year', 'pop')] == \
+            ['countyfips', 'Year', 'TotalPopulation']
+
+
+class TestCsvInt:
+
+    def test_matches_int_of_float(self):
+        for cell in ('77', ' 2024 ', '77.0', '1.5e3', '-3'):
+            assert _csv_int(cell) == int(float(cell))
+
+    def test_rejects_non_numeric(self):
+        for cell in ('', 'n/a', 'nan'):
+            with pytest.raises(ValueError):
+                _csv_int(cell)
+
+
+SYA_CSV = (
+    'county,year,age,sex,population\n'
+    '77,2024,30,Male,100\n'
+    '77,2024,70,Female,50\n'
+    '77,2030,70,Female,80\n'
+)
+
+
+class TestParseDolaSya:
+
+    def test_bad_population_cell_still_counts_year_and_age(self):
+        sya = _parse_dola_sya(SYA_CSV + '77,2035,99,Female,n/a\n')
+        assert sya['years'] == [2024, 2030, 2035]
+        assert sya['max_age'] == 99
+        assert ('08077', 2035) not in sya['totals_by_year']
+
+    def test_wide_row_keeps_male_cell_before_bad_female_cell(self):
+        text = 'county,year,age,male,female\n77,2024,30,10,12\n77,2024,31,5,x\n'
+        sya = _parse_dola_sya(text)
+        assert sya['totals_by_year'] == {('08077', 2024): 27}
+        assert sya['pyramids']['08077'] == {'male': {30: 10, 31: 5}, 'female': {30: 12}}
+
+
+class TestLoadDolaSya:
+
+    @pytest.fixture()
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('HNA_BUILD_CACHE_DIR', str(tmp_path))
+        return tmp_path
+
+    def test_parses_and_reuses_cached_aggregates(self, cache_dir, monkeypatch):
+        sya = _load_dola_sya(SYA_CSV)
+        assert sya['totals_by_year'] == {('08077', 2024): 150, ('08077', 2030): 80}
+        assert sya['age65_by_year'] == {('08077', 2024): 50, ('08077', 2030): 80}
+        assert sya['years'] == [2024, 2030]
+        assert (cache_dir / 'dola_sya_county.parsed.json').exists()
+
+        def fail(text):
+            raise AssertionError('cached aggregates were not reused')
+        monkeypatch.setattr(build_hna_data, '_parse_dola_sya', fail)
+        assert _load_dola_sya(SYA_CSV) == sya
+
+    def test_changed_text_is_reparsed(self, cache_dir):
+        _load_dola_sya(SYA_CSV)
+        sya = _load_dola_sya(SYA_CSV + '77,2030,30,Male,20\n')
+        assert sya['totals_by_year'][('08077', 2030)] == 100
+
+    def test_unusable_csv_is_not_cached(self, cache_dir):
+        assert _load_dola_sya('a,b\n1,2\n') is None
+        assert not (cache_dir / 'dola_sya_county.parsed.json').exists()
+
+    def test_no_cache_without_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('HNA_BUILD_CACHE_DIR', raising=False)
+        monkeypatch.chdir(tmp_path)
+        assert _load_dola_sya(SYA_CSV)['years'] == [2024, 2030]
+        assert os.listdir(tmp_path) == []
+
+    def test_probe_cache_dir_is_not_used(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('HNA_BUILD_CACHE_DIR', raising=False)
+        monkeypatch.setenv('ACS_PROBE_CACHE_DIR', str(tmp_path))
+        _load_dola_sya(SYA_CSV)
+        assert os.listdir(tmp_path) == []
+
+
+class TestTextCache:
+
+    def test_gz_round_trip_is_compressed_and_deterministic(self, tmp_path):
+        path = str(tmp_path / 'dola.csv.gz')
+        _write_text_cache(path, SYA_CSV * 50)
+        first = (tmp_path / 'dola.csv.gz').read_bytes()
+        assert first[:2] == b'\x1f\x8b'
+        assert len(first) < len(SYA_CSV * 50)
+        assert _read_text_cache(path) == SYA_CSV * 50
+        _write_text_cache(path, SYA_CSV * 50)
+        assert (tmp_path / 'dola.csv.gz').read_bytes() == first
+
+    def test_plain_path_is_written_as_text(self, tmp_path):
+        path = str(tmp_path / 'dola.csv')
+        _write_text_cache(path, 'a,b,c\r\n1,2,3\r\n')
+        assert (tmp_path / 'dola.csv').read_bytes() == b'a,b,c\r\n1,2,3\r\n'
+        assert _read_text_cache(path) == 'a,b,c\r\n1,2,3\r\n'
+
+
+class TestWriteJsonFiles:
+
+    def test_bytes_match_json_dump(self, tmp_path):
+        payload = {'name': 'Cañon City', 'pop': 16000, 'ratio': float('nan'), 'rows': [1, 2.5, None]}
+        path = str(tmp_path / 'out.json')
+        _write_json_files([(path, payload, 'test')])
+        expected = tmp_path / 'expected.json'
+        with open(expected, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        assert (tmp_path / 'out.json').read_bytes() == expected.read_bytes()
+        assert sorted(os.listdir(tmp_path)) == ['expected.json', 'out.json']
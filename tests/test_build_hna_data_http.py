@@ -0,0 +1,612 @@
+"""tests/test_build_hna_data_http.py
+Unit tests for the HTTP layer in ``scripts/hna/build_hna_data.py``.
+
+A throwaway ``ThreadingHTTPServer`` on 127.0.0.1 stands in for the Census /
+LEHD / DOLA hosts so the tests run offline.
+
+Tested functions
+----------------
+* ``build_hna_data.http_get_text``  — retrying text fetch (status, body)
+* ``build_hna_data.http_get``       — raw bytes fetch, raises on HTTP error
+* ``build_hna_data.http_get_stream`` — streaming fetch for the LODES OD file
+* ``build_hna_data.http_get_text_many`` — concurrent batch fetch, ordered results
+* ``build_hna_data._http_request``  — redirects, 2xx-only success
+* ``build_hna_data._http_opener``   — HTTP(S)_PROXY / NO_PROXY handling
+* ``build_hna_data.http_get_json``  — optional ACS_PROBE_CACHE_DIR cache
+* ``build_hna_data.http_get``       — same cache, raw bytes
+* ``build_hna_data.census_fetch``   — 400 → fallback URL, one request per URL
+* ``build_hna_data.fetch_counties`` — county listing fetched once per run
+* ``build_hna_data.fetch_csv_with_cache`` — ETag-conditional DOLA CSV cache
+* ``build_hna_data.fetch_places`` / ``fetch_cdps`` — one shared place listing
+* ``build_hna_data._acs_vintage_published`` — once-per-run vintage probe
+* ``build_hna_data.acs_years_to_try`` — ACS year window, read once per run
+* ``build_hna_data.fetch_acs_s0801(statewide=True)`` — wildcard ACS rows
+* ``build_hna_data._acs5_detail_tenure_for_geo`` — one statewide tenure lookup
+* ``build_hna_data.redact``         — API-key masking for log output
+* ``build_hna_data._retry_delay``   — Retry-After / jittered backoff
+
+Run with::
+
+    pytest tests/test_build_hna_data_http.py -v
+"""
+from __future__ import annotations
+
+import gzip
+import os
+import sys
+import threading
+import time
+import zlib
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# ---------------------------------------------------------------------------
+# Path setup — allow direct imports from scripts/hna without installation
+# ---------------------------------------------------------------------------
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_HNA_DIR   = os.path.join(_REPO_ROOT, 'scripts', 'hna')
+if _HNA_DIR not in sys.path:
+    sys.path.insert(0, _HNA_DIR)
+
+import build_hna_data as bhd  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # noqa: N802 — stdlib hook name
+        self.server.requests.append((self.path, self.client_address[1]))
+        if self.path.startswith('/redirect'):
+            self._send(302, b'', location='/ok')
+        elif self.path.startswith('/nolocation'):
+            self._send(302, b'moved')
+        elif self.path.startswith('/notmodified'):
+            self._send(304, b'')
+        elif self.path.startswith('/slow'):
+            with self.server.lock:
+                self.server.active += 1
+                self.server.peak = max(self.server.peak, self.server.active)
+            time.sleep(0.05)
+            with self.server.lock:
+                self.server.active -= 1
+            self._send(200, b'[]')
+        elif self.path.startswith('/busy'):
+            # Rate-limit the first hit, then succeed.
+            if sum(p.startswith('/busy') for p, _ in self.server.requests) == 1:
+                self._send(429, b'slow down', retry_after='0')
+            else:
+                self._send(200, b'[]')
+        elif self.path.startswith('/gzip') and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self._send(200, gzip.compress(b'[["NAME"],["Mesa County"]]'), encoding='gzip')
+        elif self.path.startswith('/deflate') and 'deflate' in self.headers.get('Accept-Encoding', ''):
+            self._send(200, zlib.compress(b'[["NAME"],["Mesa County"]]'), encoding='deflate')
+        elif self.path.startswith('/bad'):
+            self._send(400, b'error: unknown variable')
+        elif self.path.startswith('/missing'):
+            self._send(404, b'error: unknown variable')
+        elif self.path.startswith('/etag'):
+            if self.headers.get('If-None-Match') == '"v1"':
+                self._send(304, b'')
+            else:
+                self._send(200, b'countyfips,year,totalpopulation\n77,2024,160000\n', etag='"v1"')
+        else:
+            self._send(200, b'[["NAME"],["Mesa County"]]')
+
+    def _send(self, status, body, location=None, retry_after=None, encoding=None, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        if location:
+            self.send_header('Location', location)
+        if retry_after is not None:
+            self.send_header('Retry-After', retry_after)
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    srv.requests = []
+    srv.lock = threading.Lock()
+    srv.active = srv.peak = 0
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv, f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+class TestSuccessStatus:
+
+    def test_redirect_is_followed(self, server):
+        srv, base = server
+        assert bhd.http_get(f"{base}/redirect") == b'[["NAME"],["Mesa County"]]'
+        assert [p for p, _ in srv.requests] == ['/redirect', '/ok']
+
+    def test_redirect_without_location_is_an_error(self, server):
+        _, base = server
+        status, body = bhd.http_get_text(f"{base}/nolocation", retries=1)
+        assert status == 302
+        assert body == 'moved'
+        with pytest.raises(urllib.error.HTTPError):
+            bhd.http_get(f"{base}/nolocation")
+
+    def test_unrequested_304_is_not_success(self, server):
+        _, base = server
+        status, _, _ = bhd._http_get_text_with_headers(f"{base}/notmodified", retries=1)
+        assert status == 304
+        assert bhd.http_get_json(f"{base}/notmodified") is None
+        with pytest.raises(urllib.error.HTTPError):
+            bhd.http_get(f"{base}/notmodified")
+
+
+class TestContentEncoding:
+
+    @pytest.mark.parametrize('path', ['/gzip', '/deflate'])
+    def test_compressed_body_is_inflated(self, server, path):
+        _, base = server
+        assert bhd.http_get(f"{base}{path}") == b'[["NAME"],["Mesa County"]]'
+        assert bhd.http_get_json(f"{base}{path}") == [['NAME'], ['Mesa County']]
+
+    def test_raw_deflate_stream(self):
+        body = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw = body.compress(b'abc') + body.flush()
+        assert bhd._decode_content(raw, 'deflate') == b'abc'
+
+    def test_identity_passthrough(self):
+        assert bhd._decode_content(b'abc', None) == b'abc'
+
+
+class TestBatchFetch:
+
+    def test_results_follow_input_order(self, server):
+        srv, base = server
+        urls = [f"{base}/ok?i={i}" if i % 3 else f"{base}/missing?i={i}" for i in range(12)]
+        results = bhd.http_get_text_many(urls, retries=1, max_workers=4)
+        assert [status for status, _ in results] == [404 if i % 3 == 0 else 200 for i in range(12)]
+        assert sorted(p for p, _ in srv.requests) == sorted(u[len(base):] for u in urls)
+
+    def test_process_wide_request_limit(self, server, monkeypatch):
+        srv, base = server
+        monkeypatch.setattr(bhd, '_HTTP_SLOTS', threading.BoundedSemaphore(2))
+        lanes = [threading.Thread(target=bhd.http_get_text_many,
+                                  args=([f"{base}/slow?lane={lane}&i={i}" for i in range(4)],),
+                                  kwargs={'retries': 1, 'max_workers': 4}) for lane in range(3)]
+        for t in lanes:
+            t.start()
+        for t in lanes:
+            t.join(10)
+        assert len(srv.requests) == 12
+        assert srv.peak <= 2
+
+    def test_empty_batch(self):
+        assert bhd.http_get_text_many([]) == []
+
+
+class TestRetryDelay:
+
+    def test_retry_after_seconds(self):
+        assert bhd._retry_delay({'Retry-After': '7'}, wait=1, max_wait=30) == 7
+
+    def test_retry_after_http_date(self):
+        from datetime import datetime, timedelta, timezone
+        from email.utils import format_datetime
+        when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=20), usegmt=True)
+        assert 15 <= bhd._retry_delay({'Retry-After': when}, wait=1, max_wait=30) <= 20
+
+    def test_retry_after_is_capped(self):
+        assert bhd._retry_delay({'Retry-After': '3600'}, wait=1, max_wait=30) == 30
+
+    def test_jitter_without_header(self):
+        delays = {bhd._retry_delay({}, wait=4, max_wait=30) for _ in range(50)}
+        assert all(2 <= d <= 6 for d in delays)
+        assert len(delays) > 1
+
+    def test_unparseable_header_falls_back_to_jitter(self):
+        assert 0.5 <= bhd._retry_delay({'Retry-After': 'soon'}, wait=1, max_wait=30) <= 1.5
+
+    def test_429_is_retried_after_server_delay(self, server):
+        srv, base = server
+        status, _ = bhd.http_get_text(f"{base}/busy", retries=2)
+        assert status == 200
+        assert len(srv.requests) == 2
+
+
+class TestCensusFetch:
+
+    def test_400_uses_fallback_without_refetching_primary(self, server, monkeypatch):
+        srv, base = server
+        monkeypatch.delenv('ACS_PROBE_CACHE_DIR', raising=False)
+        assert bhd.census_fetch(f"{base}/bad", f"{base}/ok") == [['NAME'], ['Mesa County']]
+        assert [p for p, _ in srv.requests] == ['/bad', '/ok']
+
+    def test_non_400_failure_skips_fallback(self, server, monkeypatch):
+        srv, base = server
+        monkeypatch.delenv('ACS_PROBE_CACHE_DIR', raising=False)
+        assert bhd.census_fetch(f"{base}/missing", f"{base}/ok") is None
+        assert [p for p, _ in srv.requests] == ['/missing']
+
+    def test_status_is_returned_with_result(self, server):
+        _, base = server
+        assert bhd.http_get_json_with_status(f"{base}/bad") == (400, None)
+        assert bhd.http_get_json_with_status(f"{base}/ok")[0] == 200
+
+
+class TestStatePlaceListing:
+
+    def test_places_and_cdps_share_one_fetch(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, timeout=60):
+            calls.append(url)
+            return (b'[["NAME","state","place"],'
+                    b'["Fruita city, Colorado","08","28745"],'
+                    b'["Clifton CDP, Colorado","08","15165"]]')
+
+        monkeypatch.setattr(bhd, 'http_get', fake_get)
+        bhd._state_place_rows.cache_clear()
+        try:
+            places = bhd.fetch_places(place_county={})
+            cdps = bhd.fetch_cdps(place_county={})
+        finally:
+            bhd._state_place_rows.cache_clear()
+        assert [p['label'] for p in places] == ['Fruita city']
+        assert [(c['geoid'], c['label']) for c in cdps] == [('0815165', 'Clifton (CDP)')]
+        assert len(calls) == 1
+
+
+class TestCountyListing:
+
+    def test_fetched_once_and_failures_not_memoized(self, monkeypatch):
+        calls = []
+
+        def fake_get(url, timeout=60):
+            calls.append(url)
+            if len(calls) == 1:
+                raise urllib.error.URLError('offline')
+            return b'{"features":[{"attributes":{"GEOID":"08077","NAME":"Mesa"}}]}'
+
+        monkeypatch.setattr(bhd, 'http_get', fake_get)
+        bhd._county_rows.cache_clear()
+        try:
+            assert bhd.fetch_counties() == []
+            first = bhd.fetch_counties()
+            first[0]['label'] = 'changed'
+            assert bhd.fetch_counties() == [{'geoid': '08077', 'label': 'Mesa County'}]
+        finally:
+            bhd._county_rows.cache_clear()
+        assert len(calls) == 2
+
+
+class TestVintageProbe:
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(bhd, '_ACS_VINTAGES', {})
+
+    def test_only_404_marks_vintage_unpublished(self, monkeypatch):
+        statuses = {'2024': 404, '2023': 200, '2022': 503}
+        monkeypatch.setattr(bhd, 'http_get_json_with_status',
+                            lambda url, timeout=30: (statuses[url.split('/')[4]], None))
+        assert bhd._acs_vintage_published(2024, 'acs1', 'profile') is False
+        assert bhd._acs_vintage_published(2023, 'acs1', 'profile') is True
+        assert bhd._acs_vintage_published(2022, 'acs1', 'profile') is True
+
+    def test_probe_runs_once_per_vintage(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(bhd, 'http_get_json_with_status',
+                            lambda url, timeout=30: calls.append(url) or (200, None))
+        for _ in range(3):
+            bhd._acs_vintage_published(2023, 'acs5', 'subject')
+        assert len(calls) == 1
+        assert calls[0].startswith('https://api.census.gov/data/2023/acs/acs5/subject?get=NAME&for=state:08')
+
+    def test_concurrent_first_calls_probe_once(self, monkeypatch):
+        calls = []
+        gate = threading.Event()
+
+        def slow_probe(url, timeout=30):
+            calls.append(url)
+            gate.wait(5)
+            return (404, None)
+
+        monkeypatch.setattr(bhd, 'http_get_json_with_status', slow_probe)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            bhd._acs_vintage_published(2024, 'acs1', 'subject'))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        gate.set()
+        for t in threads:
+            t.join(5)
+        assert results == [False] * 4
+        assert len(calls) == 1
+
+
+class TestAcsYearWindow:
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        bhd.acs_start_year.cache_clear()
+        bhd.acs_years_to_try.cache_clear()
+        yield
+        bhd.acs_start_year.cache_clear()
+        bhd.acs_years_to_try.cache_clear()
+
+    def test_window_from_env_is_read_once(self, monkeypatch):
+        monkeypatch.setenv('ACS_START_YEAR', '2023')
+        monkeypatch.setenv('ACS_FALLBACK_YEARS', '2')
+        assert bhd.acs_years_to_try() == (2023, 2022)
+        monkeypatch.setenv('ACS_START_YEAR', '2020')
+        assert bhd.acs_years_to_try() == (2023, 2022)
+        assert bhd.acs_start_year() == 2023
+
+
+class TestStatewideRows:
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(bhd, '_ACS_STATEWIDE_ROWS', {})
+        monkeypatch.setattr(bhd, '_acs_vintage_published', lambda *a, **k: True)
+
+    def test_geographies_share_one_wildcard_request(self, monkeypatch):
+        calls = []
+
+        def fake_json(url, timeout=30):
+            calls.append(url)
+            return [['S0801_C01_001E', 'NAME', 'state', 'county'],
+                    ['100', 'Mesa County', '08', '077'],
+                    ['200', 'Garfield County', '08', '045']]
+
+        monkeypatch.setattr(bhd, 'http_get_json', fake_json)
+        mesa = bhd.fetch_acs_s0801('county', '08077', statewide=True)
+        garfield = bhd.fetch_acs_s0801('county', '08045', statewide=True)
+        assert (mesa['S0801_C01_001E'], garfield['S0801_C01_001E']) == ('100', '200')
+        assert mesa['_acsSeries'] == 'acs1'
+        assert len(calls) == 1
+        assert 'for=county:*&in=state:08' in calls[0]
+
+    def test_failed_wildcard_falls_back_to_single_geography(self, monkeypatch):
+        calls = []
+
+        def fake_json(url, timeout=30):
+            calls.append(url)
+            if 'county:*' in url:
+                return None
+            return [['S0801_C01_001E', 'NAME', 'state', 'county'], ['100', 'Mesa County', '08', '077']]
+
+        monkeypatch.setattr(bhd, 'http_get_json', fake_json)
+        assert bhd.fetch_acs_s0801('county', '08077', statewide=True)['S0801_C01_001E'] == '100'
+        assert ['county:*' in u for u in calls] == [True, False]
+
+    def test_slow_wildcard_does_not_block_other_keys(self, monkeypatch):
+        release = threading.Event()
+        calls = []
+
+        def fake_json(url, timeout=30):
+            calls.append(url)
+            if 'county:*' in url:
+                release.wait(5)
+                return [['S0801_C01_001E', 'NAME', 'state', 'county'], ['100', 'Mesa County', '08', '077']]
+            return [['S0801_C01_001E', 'NAME', 'state', 'place'], ['7', 'Aspen city', '08', '03620']]
+
+        monkeypatch.setattr(bhd, 'http_get_json', fake_json)
+        results = []
+        workers = [threading.Thread(target=lambda: results.append(
+            bhd._acs_statewide_row(2023, 'acs1/subject', 'S0801_C01_001E,NAME', 'county', '08077')))
+            for _ in range(2)]
+        for w in workers:
+            w.start()
+        # The county wildcard is still in flight; a place lookup is not held up.
+        assert bhd._acs_statewide_row(2023, 'acs1/subject', 'S0801_C01_001E,NAME', 'place', '0803620')[1]['NAME'] == 'Aspen city'
+        release.set()
+        for w in workers:
+            w.join(5)
+        assert [r[1]['NAME'] for r in results] == ['Mesa County', 'Mesa County']
+        assert sum('county:*' in u for u in calls) == 1
+
+
+class TestTenureLookup:
+
+    def test_concurrent_geographies_share_one_lookup(self, monkeypatch):
+        monkeypatch.setattr(bhd, '_ACS5_DETAIL_TENURE', {})
+        release = threading.Event()
+        calls = []
+
+        def fake_json(url, timeout=30):
+            calls.append(url)
+            release.wait(5)
+            if 'for=county:*' in url:
+                return [['B25003_001E', 'state', 'county'], ['900', '08', '077']]
+            return [['B25003_001E', 'state', 'place'], ['40', '08', '03620']]
+
+        monkeypatch.setattr(bhd, 'http_get_json', fake_json)
+        results = []
+        workers = [threading.Thread(target=lambda: results.append(
+            bhd._acs5_detail_tenure_for_geo('county', '08077', (2023,))['B25003_001E'])) for _ in range(3)]
+        for w in workers:
+            w.start()
+        release.set()
+        for w in workers:
+            w.join(5)
+        assert results == ['900'] * 3
+        assert len(calls) == 2
+        assert bhd._acs5_detail_tenure_for_geo('place', '0803620', (2023,))['B25003_001E'] == '40'
+        assert len(calls) == 2
+
+
+class TestErrorStatus:
+
+    def test_http_get_text_returns_error_status_and_body(self, server):
+        _, base = server
+        status, body = bhd.http_get_text(f"{base}/missing", retries=1)
+        assert status == 404
+        assert 'unknown variable' in body
+
+    def test_http_get_raises_http_error(self, server):
+        _, base = server
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            bhd.http_get(f"{base}/missing")
+        assert exc.value.code == 404
+
+    def test_stream_reads_body_and_raises_http_error(self, server, monkeypatch):
+        _, base = server
+        monkeypatch.delenv('ACS_PROBE_CACHE_DIR', raising=False)
+        with bhd.http_get_stream(f"{base}/ok") as resp:
+            assert resp.read() == b'[["NAME"],["Mesa County"]]'
+        with bhd.http_get_stream(f"{base}/redirect") as resp:
+            assert resp.read() == b'[["NAME"],["Mesa County"]]'
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            bhd.http_get_stream(f"{base}/missing")
+        assert exc.value.code == 404
+
+    def test_network_failure_returns_status_zero(self):
+        status, _ = bhd.http_get_text('http://127.0.0.1:9/refused', timeout=2, retries=1)
+        assert status == 0
+
+
+class TestProxy:
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        for name in ('http_proxy', 'HTTP_PROXY', 'https_proxy', 'HTTPS_PROXY', 'no_proxy', 'NO_PROXY'):
+            monkeypatch.delenv(name, raising=False)
+        bhd._http_opener.cache_clear()
+        yield
+        bhd._http_opener.cache_clear()
+
+    def test_http_proxy_gets_absolute_uri(self, server, monkeypatch):
+        srv, base = server
+        monkeypatch.setenv('http_proxy', base)
+        assert bhd.http_get('http://census.invalid/data?get=NAME') == b'[["NAME"],["Mesa County"]]'
+        with bhd.http_get_stream('http://census.invalid/od.csv.gz') as resp:
+            assert resp.read() == b'[["NAME"],["Mesa County"]]'
+        assert [p for p, _ in srv.requests] == ['http://census.invalid/data?get=NAME',
+                                                'http://census.invalid/od.csv.gz']
+
+    def test_no_proxy_bypasses_proxy(self, server, monkeypatch):
+        _, base = server
+        monkeypatch.setenv('http_proxy', 'http://127.0.0.1:9')
+        monkeypatch.setenv('no_proxy', '127.0.0.1')
+        assert bhd.http_get(f"{base}/ok") == b'[["NAME"],["Mesa County"]]'
+
+    def test_opener_is_shared(self):
+        assert bhd._http_opener() is bhd._http_opener()
+
+
+class TestProbeCache:
+
+    def test_disabled_without_env(self, monkeypatch):
+        monkeypatch.delenv('ACS_PROBE_CACHE_DIR', raising=False)
+        assert bhd._probe_cache_path('https://api.census.gov/data/2023/acs/acs5?get=NAME') is None
+
+    def test_cache_key_ignores_api_key(self, monkeypatch, tmp_path):
+        monkeypatch.setenv('ACS_PROBE_CACHE_DIR', str(tmp_path))
+        base = 'https://api.census.gov/data/2023/acs/acs5?get=NAME&for=county:*'
+        assert bhd._probe_cache_path(base + '&key=aaaaaaaa') == bhd._probe_cache_path(base + '&key=bbbbbbbb')
+        assert bhd._probe_cache_path(base) != bhd._probe_cache_path(base + '&in=state:08')
+
+    def test_repeat_fetch_served_from_cache(self, server, monkeypatch, tmp_path):
+        srv, base = server
+        monkeypatch.setenv('ACS_PROBE_CACHE_DIR', str(tmp_path))
+        first = bhd.http_get_json(f"{base}/ok?get=NAME")
+        second = bhd.http_get_json(f"{base}/ok?get=NAME")
+        assert first == second == [['NAME'], ['Mesa County']]
+        assert len(srv.requests) == 1
+
+    def test_raw_get_served_from_cache(self, server, monkeypatch, tmp_path):
+        srv, base = server
+        monkeypatch.setenv('ACS_PROBE_CACHE_DIR', str(tmp_path))
+        assert bhd.http_get(f"{base}/ok?get=NAME") == bhd.http_get(f"{base}/ok?get=NAME")
+        assert len(srv.requests) == 1
+        with pytest.raises(urllib.error.HTTPError):
+            bhd.http_get(f"{base}/missing")
+        with pytest.raises(urllib.error.HTTPError):
+            bhd.http_get(f"{base}/missing")
+        assert len(srv.requests) == 3
+
+    def test_failure_entry_expires_quickly(self, server, monkeypatch, tmp_path):
+        srv, base = server
+        monkeypatch.setenv('ACS_PROBE_CACHE_DIR', str(tmp_path))
+        assert bhd.http_get_json(f"{base}/missing") is None
+        monkeypatch.setattr(bhd, '_PROBE_CACHE_TTL_FAIL', 0)
+        assert bhd.http_get_json(f"{base}/missing") is None
+        assert len(srv.requests) == 2
+
+
+class TestConditionalCsvCache:
+
+    @pytest.fixture()
+    def source_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('HNA_BUILD_CACHE_DIR', str(tmp_path / 'build'))
+        source = tmp_path / 'source'
+        source.mkdir()
+        return source
+
+    def test_unchanged_source_served_from_cache(self, server, source_dir):
+        srv, base = server
+        cache_path = str(source_dir / 'dola.csv.gz')
+        first = bhd.fetch_csv_with_cache(f"{base}/etag", cache_path, 'test csv', timeout=5)
+        assert first.startswith('countyfips,year')
+        assert bhd._cache_validators(cache_path, f"{base}/etag") == {'If-None-Match': '"v1"'}
+        assert bhd.fetch_csv_with_cache(f"{base}/etag", cache_path, 'test csv', timeout=5) == first
+        assert len(srv.requests) == 2
+        # Nothing but the cache itself lands in the (committed) source dir.
+        assert os.listdir(source_dir) == ['dola.csv.gz']
+
+    def test_validators_need_matching_url_and_cache(self, server, source_dir):
+        _, base = server
+        cache_path = str(source_dir / 'dola.csv.gz')
+        bhd.fetch_csv_with_cache(f"{base}/etag", cache_path, 'test csv', timeout=5)
+        assert bhd._cache_validators(cache_path, f"{base}/etag?v=2") == {}
+        bhd._write_text_cache(cache_path, 'countyfips,year\n77,2025\n')
+        assert bhd._cache_validators(cache_path, f"{base}/etag") == {}
+        os.remove(cache_path)
+        assert bhd._cache_validators(cache_path, f"{base}/etag") == {}
+
+    def test_unconditional_without_build_cache_dir(self, server, tmp_path, monkeypatch):
+        srv, base = server
+        monkeypatch.delenv('HNA_BUILD_CACHE_DIR', raising=False)
+        cache_path = str(tmp_path / 'dola.csv.gz')
+        bhd.fetch_csv_with_cache(f"{base}/etag", cache_path, 'test csv', timeout=5)
+        assert bhd._cache_validators(cache_path, f"{base}/etag") == {}
+        assert os.listdir(tmp_path) == ['dola.csv.gz']
+
+
+@pytest.fixture()
+def api_keys(monkeypatch):
+    def _set(**env):
+        for name in ('CENSUS_API_KEY', 'FRED_API_KEY'):
+            if name in env:
+                monkeypatch.setenv(name, env[name])
+            else:
+                monkeypatch.delenv(name, raising=False)
+        bhd._redactor.cache_clear()
+    yield _set
+    bhd._redactor.cache_clear()
+
+
+class TestRedact:
+
+    def test_masks_both_keys(self, api_keys):
+        api_keys(CENSUS_API_KEY='census-key-1234', FRED_API_KEY='fred-key-5678')
+        out = bhd.redact('a?key=census-key-1234&api_key=fred-key-5678&x=census-key-1234')
+        assert out == 'a?key=***CENSUS_API_KEY***&api_key=***FRED_API_KEY***&x=***CENSUS_API_KEY***'
+
+    def test_short_keys_are_ignored(self, api_keys):
+        api_keys(CENSUS_API_KEY='a', FRED_API_KEY='')
+        assert bhd.redact('a banana') == 'a banana'
+
+    def test_no_keys_returns_input(self, api_keys):
+        api_keys()
+        assert bhd.redact('https://api.census.gov/data?get=NAME') == 'https://api.census.gov/data?get=NAME'
@@ -0,0 +1,56 @@
+"""tests/test_build_hna_data_lodes.py
+Unit tests for the LEHD LODES OD aggregation in ``scripts/hna/build_hna_data.py``.
+
+Tested functions
+----------------
+* ``build_hna_data._aggregate_lodes_od`` — within / inflow / outflow job sums
+
+Run with::
+
+    pytest tests/test_build_hna_data_lodes.py -v
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+
+# ---------------------------------------------------------------------------
+# Path setup — allow direct imports from scripts/hna without installation
+# ---------------------------------------------------------------------------
+_REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_HNA_DIR   = os.path.join(_REPO_ROOT, 'scripts', 'hna')
+if _HNA_DIR not in sys.path:
+    sys.path.insert(0, _HNA_DIR)
+
+from build_hna_data import _aggregate_lodes_od  # noqa: E402
+
+OD_CSV = (
+    'w_geocode,h_geocode,S000,SA01,createdate\n'
+    '080770001001000,080770002002000,10,3,20240101\n'   # within Mesa
+    '080770001001000,080450001001000,4,1,20240101\n'    # Garfield -> Mesa
+    '080450001001000,080770001001000,6,2,20240101\n'    # Mesa -> Garfield
+    '080770001001000,080770003003000,5,2,20240101\n'    # within Mesa
+)
+
+
+class TestAggregateLodesOd:
+
+    def test_sums_within_inflow_outflow(self):
+        within, inflow, outflow = _aggregate_lodes_od(io.StringIO(OD_CSV))
+        assert within == {'08077': 15}
+        assert inflow == {'08077': 4, '08045': 6}
+        assert outflow == {'08045': 4, '08077': 6}
+
+    def test_skips_bad_and_zero_rows(self):
+        text = OD_CSV + (
+            '080770001001000,0807,7,1,20240101\n'               # short geocode
+            '080770001001000,080450001001000,0,0,20240101\n'    # zero jobs
+            '080770001001000,080450001001000,n/a,0,20240101\n'  # non-numeric
+            '080770001001000\n'                                 # truncated row
+        )
+        assert _aggregate_lodes_od(io.StringIO(text)) == _aggregate_lodes_od(io.StringIO(OD_CSV))
+
+    def test_missing_columns_yield_empty_sums(self):
+        assert _aggregate_lodes_od(io.StringIO('a,b,c\n1,2,3\n')) == ({}, {}, {})
+        assert _aggregate_lodes_od(io.StringIO('')) == ({}, {}, {})